@@ -1,9 +1,11 @@
 """
 art_assets.py - Contains ASCII art assets used by the application.
 
-Version: 1.0
+Version: 1.1
 """
 
+from typing import Tuple
+
 HEADER_ART = [
     "=== HEADER ART PLACEHOLDER ===",
     "You can replace this with your own artwork."
@@ -32,7 +34,7 @@ BORDERS = [
     "+++ BORDERS PLACEHOLDER +++"
 ]
 
-STAR_ART = [
+STAR_ART: Tuple[str, ...] = (
     "     .       +  ':.  .      *              '            *  '",
     "                  '::._                                      ",
     "                    '._)                 * +              ' ",
@@ -52,6 +54,6 @@ STAR_ART = [
     "                       +      .'                   '.       ",
     " .           .           o      .       . .      .          ",
     "                       '       . +~~                       .",
-]
+)
 
-BACKGROUND_ART = []
\ No newline at end of file
+BACKGROUND_ART: Tuple[str, ...] = ()
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+core/collision.py - Broad-phase collision helpers.
+--------------------------------------------------------------------------------
+Version: 1.0.1
+Summary: Provides a QuadTree for finding objects whose bounding boxes may overlap a query box, so
+         game modes only run exact (narrow-phase) hit tests on nearby pairs instead of every pair.
+         Nodes live in parallel pooled lists that clear() keeps, so rebuilding the tree every frame
+         does not allocate new nodes.
+
+Typical per-frame use:
+    tree.clear()
+    for enemy in enemies:
+        tree.insert(enemy, enemy_aabb)
+    for bullet in bullets:
+        for enemy in tree.query(bullet_aabb):
+            ...  # narrow-phase test
+"""
+
+from typing import Any, List, Tuple
+
+# Axis-aligned bounding box as (left, top, right, bottom).
+AABB = Tuple[float, float, float, float]
+
+def aabbs_overlap(a: AABB, b: AABB) -> bool:
+    """
+    Returns True if two boxes overlap or touch.
+    """
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+class QuadTree:
+    """
+    A region quadtree over axis-aligned bounding boxes.
+
+    A leaf holds up to `capacity` entries before it splits into four quadrants (NW, NE, SW, SE).
+    An entry that straddles a quadrant boundary, or lies outside the tree's bounds, stays in the
+    node where it stopped fitting, so every entry is stored exactly once.
+    """
+
+    def __init__(self, bounds: AABB, capacity: int = 4, max_depth: int = 8) -> None:
+        """
+        Initializes an empty QuadTree.
+
+        Parameters:
+            bounds (AABB): The region covered by the root node, usually the screen.
+            capacity (int): Entries a leaf holds before it splits.
+            max_depth (int): Depth below which leaves no longer split.
+        """
+        self.bounds: AABB = bounds
+        self.capacity: int = capacity
+        self.max_depth: int = max_depth
+        # Node pool as parallel lists; node i uses index i of each. Entries past _node_count are spare.
+        self._node_bounds: List[AABB] = []
+        self._node_depths: List[int] = []
+        self._first_child: List[int] = []  # Index of the NW child (NE, SW, SE follow), or -1 for a leaf
+        self._node_items: List[List[Tuple[AABB, Any]]] = []
+        self._node_count: int = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Removes every entry, keeping the node pool for reuse.
+        """
+        self._node_count = 0
+        self._new_node(self.bounds, 0)
+
+    def _new_node(self, bounds: AABB, depth: int) -> int:
+        """
+        Takes a node from the pool, growing the pool only when every node is in use.
+
+        Returns:
+            int: The index of the new leaf node.
+        """
+        index = self._node_count
+        if index == len(self._node_bounds):
+            self._node_bounds.append(bounds)
+            self._node_depths.append(depth)
+            self._first_child.append(-1)
+            self._node_items.append([])
+        else:
+            self._node_bounds[index] = bounds
+            self._node_depths[index] = depth
+            self._first_child[index] = -1
+            self._node_items[index].clear()
+        self._node_count = index + 1
+        return index
+
+    def _quadrant(self, node: int, aabb: AABB) -> int:
+        """
+        Returns the quadrant of the node (0 NW, 1 NE, 2 SW, 3 SE) that fully contains the box,
+        or -1 if the box crosses a quadrant boundary or is not fully inside the node.
+        """
+        left, top, right, bottom = self._node_bounds[node]
+        if aabb[0] < left or aabb[2] > right or aabb[1] < top or aabb[3] > bottom:
+            return -1
+        center_x = (left + right) / 2
+        center_y = (top + bottom) / 2
+        if aabb[2] < center_x:
+            column = 0
+        elif aabb[0] >= center_x:
+            column = 1
+        else:
+            return -1
+        if aabb[3] < center_y:
+            return column
+        if aabb[1] >= center_y:
+            return column + 2
+        return -1
+
+    def _split(self, node: int) -> None:
+        """
+        Turns a leaf into an internal node and moves the entries that fit a quadrant down into it.
+        """
+        left, top, right, bottom = self._node_bounds[node]
+        center_x = (left + right) / 2
+        center_y = (top + bottom) / 2
+        depth = self._node_depths[node] + 1
+        first = self._new_node((left, top, center_x, center_y), depth)
+        self._new_node((center_x, top, right, center_y), depth)
+        self._new_node((left, center_y, center_x, bottom), depth)
+        self._new_node((center_x, center_y, right, bottom), depth)
+        self._first_child[node] = first
+        kept = []
+        for entry in self._node_items[node]:
+            quadrant = self._quadrant(node, entry[0])
+            if quadrant < 0:
+                kept.append(entry)
+            else:
+                self._node_items[first + quadrant].append(entry)
+        self._node_items[node][:] = kept
+
+    def insert(self, obj: Any, aabb: AABB) -> None:
+        """
+        Adds an object with its bounding box.
+
+        Parameters:
+            obj (Any): The object returned by matching queries.
+            aabb (AABB): The object's bounding box.
+        """
+        node = 0
+        while True:
+            first = self._first_child[node]
+            if first < 0:
+                items = self._node_items[node]
+                items.append((aabb, obj))
+                if len(items) > self.capacity and self._node_depths[node] < self.max_depth:
+                    self._split(node)
+                return
+            quadrant = self._quadrant(node, aabb)
+            if quadrant < 0:
+                self._node_items[node].append((aabb, obj))
+                return
+            node = first + quadrant
+
+    def query(self, aabb: AABB) -> List[Any]:
+        """
+        Finds the objects whose bounding boxes overlap the query box.
+
+        Parameters:
+            aabb (AABB): The query box.
+
+        Returns:
+            List[Any]: The matching objects, in no particular order.
+        """
+        found: List[Any] = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            for item_aabb, obj in self._node_items[node]:
+                if aabbs_overlap(item_aabb, aabb):
+                    found.append(obj)
+            first = self._first_child[node]
+            if first >= 0:
+                for child in range(first, first + 4):
+                    if aabbs_overlap(self._node_bounds[child], aabb):
+                        stack.append(child)
+        return found
+
+# End of core/collision.py
@@ -1,11 +1,16 @@
 """
 core/config.py - Global configuration using a dataclass.
 --------------------------------------------------------------------------------
-Version: 1.5.1
+Version: 1.6.2
 Summary: Updated for mouse/touch-only input. Removed global keyboard input keys.
+         Objects can register resize listeners to refresh scale-derived values only when the
+         screen dimensions change; scale_value results are memoized until then. Listeners of
+         discarded objects are pruned whenever a new listener is added.
 """
 
+import weakref
 from dataclasses import dataclass, field
+from typing import Callable, Dict, List
 from themes.themes import ACTIVE_THEME, Theme  # Import ACTIVE_THEME from themes.py
 
 @dataclass
@@ -20,6 +25,8 @@ class Config:
     theme: Theme = field(default_factory=lambda: ACTIVE_THEME)
     selected_game_mode: str = "default"  # New attribute for the selected game mode
     enable_global_controls: bool = True  # Flag to enable global control layers (for mouse/touch)
+    _resize_listeners: List["weakref.WeakMethod"] = field(default_factory=list, init=False, repr=False, compare=False)
+    _scale_cache: Dict[float, int] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def update_dimensions(self, width: int, height: int) -> None:
         """
@@ -32,12 +39,36 @@ class Config:
             self.screen_width / self.base_width,
             self.screen_height / self.base_height
         )
+        self._scale_cache.clear()
+        live: List["weakref.WeakMethod"] = []
+        for ref in self._resize_listeners:
+            callback = ref()
+            if callback is not None:
+                callback()
+                live.append(ref)
+        self._resize_listeners = live
+
+    def add_resize_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Registers a bound method to be called after update_dimensions changes the screen size.
+        Listeners are held weakly, so discarded layers never need to unregister; their dead
+        references are dropped here, so layers rebuilt on every scene entry do not pile up.
+        Version: 1.6.2
+        """
+        listeners = [ref for ref in self._resize_listeners if ref() is not None]
+        listeners.append(weakref.WeakMethod(callback))
+        self._resize_listeners = listeners
 
     def scale_value(self, base_value: int) -> int:
         """
         Scales the provided base value using the current scale factor.
-        Version: 1.5.1
+        Results are cached until update_dimensions changes the scale.
+        Version: 1.6.1
         """
-        return int(base_value * self.scale)
+        try:
+            return self._scale_cache[base_value]
+        except KeyError:
+            value = self._scale_cache[base_value] = int(base_value * self.scale)
+            return value
 
 # End of core/config.py
\ No newline at end of file
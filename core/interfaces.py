@@ -1,14 +1,17 @@
 """
 core/interfaces.py - Defines explicit interfaces for event handlers.
 --------------------------------------------------------------------------------
-Version: 1.0
-Summary: Provides the input handler interface using mouse/touch events.
+Version: 1.2.1
+Summary: Provides the input handler interface using mouse/touch events, plus an InputHandler base class
+         with a no-op on_input that objects registered with InputManager subclass.
+         IInputHandler is a static typing Protocol only; at runtime handlers are duck-typed (InputManager
+         calls on_input on whatever is registered, and LayerManager picks input layers by whether they
+         have an on_input attribute), so nothing pays for structural isinstance checks.
 """
 
-from typing import Protocol, runtime_checkable
+from typing import Optional, Protocol
 import pygame
 
-@runtime_checkable
 class IInputHandler(Protocol):
     def on_input(self, event: pygame.event.Event) -> None:
         """
@@ -16,4 +19,16 @@ class IInputHandler(Protocol):
         """
         ...
 
+class InputHandler:
+    """
+    Base class for objects registered with InputManager. InputManager calls on_input directly,
+    so subclasses only override it when they consume events.
+    """
+
+    def on_input(self, event: pygame.event.Event) -> Optional[bool]:
+        """
+        Handle an input event. Returning a truthy value stops dispatch to later handlers.
+        """
+        return None
+
 # End of core/interfaces.py
\ No newline at end of file
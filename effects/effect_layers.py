@@ -1,37 +1,64 @@
 """
 effect_layers.py - Provides effect layers such as the rain effect and snow effect.
-Version: 1.2.2 (fixed references to theme-based rain/snow colors)
+Version: 1.6.2
+Summary: Rain and snow particles are stored as parallel NumPy arrays (one array per field) and
+         updated with vectorized operations; rain drops and snowflakes are blitted from cached
+         sprites (a single atlas for snow) in one batched call each. Both layers take the
+         standard (font, config) layer constructor arguments.
 """
 
 import pygame
-import random
-from typing import Dict, List
-from layers.base_layer import BaseLayer
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from layers.base_layer import BaseLayer, blit_sequence, to_display_format
 from ui.layout_constants import LayerZIndex  # Removed EffectColors import
 from core.config import Config
 from plugins.plugins import register_layer
 
+SNOW_NOISE_FRAMES: int = 64  # Frames of snow drift noise and respawn positions sampled per batch.
+
 
 @register_layer("rain_effect", "effect")
 class RainEffectLayer(BaseLayer):
-    def __init__(self, config: Config) -> None:
+    __slots__ = (
+        "z", "font", "config", "num_lines", "_drop", "_drop_color", "line_length", "speed", "xs", "ys",
+        "__weakref__",  # For the resize listener
+    )
+    persistent = True  # Persistent to maintain state across scenes.
+
+    def __init__(self, font: pygame.font.Font, config: Config) -> None:
         """
         Initializes the RainEffectLayer with the provided configuration.
 
         Parameters:
+            font (pygame.font.Font): The font used for rendering (standardized, even if not used).
             config (Config): The configuration object containing screen dimensions and scale.
         """
+        self.font: pygame.font.Font = font
         self.z: int = LayerZIndex.RAIN_EFFECT
         self.config: Config = config
-        self.lines: List[Dict[str, float]] = []
         self.num_lines: int = 50
-
-        self.persistent = True  # Mark this layer as persistent to maintain state across scenes.
-        for _ in range(self.num_lines):
-            x: float = random.uniform(0, self.config.screen_width)
-            y: float = random.uniform(0, self.config.screen_height)
-            length: int = self.config.scale_value(10)
-            self.lines.append({"x": x, "y": y, "length": length})
+        # Pre-filled vertical drop, rebuilt only when the theme's rain color or the drop length changes.
+        self._drop: Optional[pygame.Surface] = None
+        self._drop_color: Optional[Tuple[int, int, int]] = None
+        # Scaled drop length and fall speed, refreshed by _on_resize() when the screen size changes.
+        self.line_length: int = 0
+        self.speed: int = 0
+        self._on_resize()
+        self.config.add_resize_listener(self._on_resize)
+
+        # Drop positions, one array per coordinate.
+        rng = np.random.default_rng()
+        self.xs: np.ndarray = rng.uniform(0, self.config.screen_width, self.num_lines).astype(np.float32)
+        self.ys: np.ndarray = rng.uniform(0, self.config.screen_height, self.num_lines).astype(np.float32)
+
+    def _on_resize(self) -> None:
+        """
+        Recomputes the scaled drop length and fall speed after the screen size changes.
+        """
+        self.line_length = self.config.scale_value(10)
+        self.speed = self.config.scale_value(5)
+        self._drop_color = None  # Rebuild the drop at the new length on the next draw.
 
     def update(self, dt: float) -> None:
         """
@@ -40,11 +67,9 @@ class RainEffectLayer(BaseLayer):
         Parameters:
             dt (float): Delta time in seconds.
         """
-        speed: int = self.config.scale_value(5)
-        for line in self.lines:
-            line["y"] += speed * dt
-            if line["y"] > self.config.screen_height:
-                line["y"] = -line["length"]
+        ys = self.ys
+        ys += self.speed * dt
+        ys[ys > self.config.screen_height] = -self.line_length
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -55,53 +80,130 @@ class RainEffectLayer(BaseLayer):
         """
         # Use the theme's rain color
         color = self.config.theme.rain_color
-        for line in self.lines:
-            start_pos = (int(line["x"]), int(line["y"]))
-            end_pos = (int(line["x"]), int(line["y"] + line["length"]))
-            pygame.draw.line(screen, color, start_pos, end_pos, 1)
+        if color != self._drop_color:
+            # A 1px line from y to y + length covers length + 1 pixels.
+            self._drop = pygame.Surface((1, self.line_length + 1))
+            self._drop.fill(color)
+            self._drop_color = color
+        drop = self._drop
+        length = self.line_length
+        # Anchor on the bottom pixel, int(y + length), as draw.line did; for drops entering
+        # above the screen the top pixel may differ, but it is off-screen.
+        positions = np.column_stack((self.xs.astype(np.intp), (self.ys + length).astype(np.intp) - length))
+        blit_sequence(screen, [(drop, pos) for pos in positions.tolist()])
 
 
 @register_layer("snow_effect", "effect")
 class SnowEffectLayer(BaseLayer):
-    def __init__(self, config: Config) -> None:
+    __slots__ = (
+        "z", "font", "config", "num_snowflakes", "_rng", "_positions", "_velocities", "_step",
+        "xs", "ys", "drifts", "speeds", "sizes", "_radii", "_atlas", "_areas", "_sprite_color",
+        "_neg_sizes", "_fallen", "_noise", "_spawn", "_noise_index",
+    )
+    persistent = True  # Persistent to maintain state across scenes.
+
+    def __init__(self, font: pygame.font.Font, config: Config) -> None:
         """
         Initializes the SnowEffectLayer with the provided configuration.
 
         Parameters:
+            font (pygame.font.Font): The font used for rendering (standardized, even if not used).
             config (Config): The configuration object containing screen dimensions and scale.
         """
+        self.font: pygame.font.Font = font
         self.z: int = LayerZIndex.RAIN_EFFECT  # Same z-index as rain effect; adjust if needed.
         self.config: Config = config
         self.num_snowflakes: int = 100  # Increased density: more snowflakes.
-        self.snowflakes: List[Dict[str, any]] = []
-        self.persistent = True  # Mark this layer as persistent to maintain state across scenes.
-
-        for _ in range(self.num_snowflakes):
-            snowflake = {
-                "x": random.uniform(0, self.config.screen_width),
-                "y": random.uniform(0, self.config.screen_height),
-                "size": random.uniform(4, 8),   # Larger size range.
-                "speed": random.uniform(20, 40),  # Increased speed range.
-                "drift": random.uniform(-0.5, 0.5)  # Horizontal drift.
-            }
-            self.snowflakes.append(snowflake)
+
+        # Snowflake state, one array per field.
+        n: int = self.num_snowflakes
+        self._rng: np.random.Generator = np.random.default_rng()
+        rng = self._rng
+        # Positions and velocities are stored as (2, n) blocks so one operation moves both axes;
+        # xs/ys and drifts/speeds are row views into them.
+        self._positions: np.ndarray = np.empty((2, n), dtype=np.float32)
+        self._velocities: np.ndarray = np.empty((2, n), dtype=np.float32)
+        self._step: np.ndarray = np.empty((2, n), dtype=np.float32)  # Scratch for update().
+        self.xs, self.ys = self._positions
+        self.drifts, self.speeds = self._velocities
+        self.xs[:] = rng.uniform(0, self.config.screen_width, n)
+        self.ys[:] = rng.uniform(0, self.config.screen_height, n)
+        self.sizes: np.ndarray = rng.uniform(4, 8, n).astype(np.float32)  # Larger size range.
+        self.speeds[:] = rng.uniform(20, 40, n)  # Increased speed range.
+        self.drifts[:] = rng.uniform(-0.5, 0.5, n)  # Horizontal drift.
+        self._radii: List[int] = self.sizes.astype(np.intp).tolist()  # Sizes never change.
+        self._neg_sizes: np.ndarray = -self.sizes  # Respawn heights, just above the screen.
+        self._fallen: np.ndarray = np.empty(n, dtype=bool)  # Scratch mask for update().
+        # Atlas of pre-rendered flakes (one per radius) and each flake's source rect in it,
+        # rebuilt only when the theme's snow color changes.
+        self._atlas: Optional[pygame.Surface] = None
+        self._areas: List[pygame.Rect] = []
+        self._sprite_color: Optional[Tuple[int, int, int]] = None
+        # Drift noise and respawn x positions (as fractions of the screen width) are sampled
+        # SNOW_NOISE_FRAMES frames at a time and consumed one row per update.
+        self._noise: np.ndarray = np.empty((0, n), dtype=np.float32)
+        self._spawn: np.ndarray = np.empty((0, n), dtype=np.float32)
+        self._noise_index: int = 0
+
+    def _build_atlas(self, color: Tuple[int, int, int]) -> None:
+        """
+        Renders one flake per radius side by side into a single atlas surface, exactly as
+        pygame.draw.circle would draw it on the screen (covering the 2r x 2r box starting at
+        (x - r, y - r)), and records each flake's source rect.
+
+        Parameters:
+            color (Tuple[int, int, int]): The snow color.
+        """
+        radii = sorted(set(self._radii))
+        atlas = pygame.Surface((sum(2 * r for r in radii), 2 * max(radii)), pygame.SRCALPHA)
+        rects: Dict[int, pygame.Rect] = {}
+        offset = 0
+        for radius in radii:
+            pygame.draw.circle(atlas, color, (offset + radius, radius), radius)
+            rects[radius] = pygame.Rect(offset, 0, 2 * radius, 2 * radius)
+            offset += 2 * radius
+        self._atlas = to_display_format(atlas)
+        self._areas = [rects[radius] for radius in self._radii]
+
+    def _next_random(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns one frame of drift noise and respawn fractions, refilling the pre-sampled
+        batch when it runs out.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Drift noise and respawn x fraction per snowflake.
+        """
+        if self._noise_index >= len(self._noise):
+            shape = (SNOW_NOISE_FRAMES, self.num_snowflakes)
+            self._noise = self._rng.uniform(-0.05, 0.05, shape).astype(np.float32)
+            self._spawn = self._rng.random(shape, dtype=np.float32)
+            self._noise_index = 0
+        index = self._noise_index
+        self._noise_index += 1
+        return self._noise[index], self._spawn[index]
 
     def update(self, dt: float) -> None:
         """
         Updates the snow effect layer by moving each snowflake.
-        Snowflakes gently fall with a slight horizontal drift.
+        Snowflakes gently fall with a slight horizontal drift; fallen flakes respawn above the
+        screen through masked copies from pre-sampled positions.
 
         Parameters:
             dt (float): Delta time in seconds.
         """
-        for flake in self.snowflakes:
-            flake["y"] += flake["speed"] * dt
-            flake["x"] += flake["drift"] * dt
-            flake["drift"] += random.uniform(-0.05, 0.05) * dt
-            flake["drift"] = max(min(flake["drift"], 1), -1)
-            if flake["y"] > self.config.screen_height:
-                flake["y"] = -flake["size"]
-                flake["x"] = random.uniform(0, self.config.screen_width)
+        xs, ys, drifts = self.xs, self.ys, self.drifts
+        noise, spawn = self._next_random()
+        step = np.multiply(self._velocities, dt, out=self._step)
+        self._positions += step
+        scratch = step[0]
+        drifts += np.multiply(noise, dt, out=scratch)
+        # Clamp drift to [-1, 1]; minimum/maximum are cheaper than np.clip on small arrays.
+        np.minimum(drifts, 1, out=drifts)
+        np.maximum(drifts, -1, out=drifts)
+        fallen = np.greater(ys, self.config.screen_height, out=self._fallen)
+        if np.count_nonzero(fallen):  # Most frames respawn nothing; skip the masked copies then.
+            np.copyto(ys, self._neg_sizes, where=fallen)
+            np.copyto(xs, np.multiply(spawn, self.config.screen_width, out=scratch), where=fallen)
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -112,8 +214,14 @@ class SnowEffectLayer(BaseLayer):
         """
         # Use the theme's snow color
         snow_color = self.config.theme.snow_color
-        for flake in self.snowflakes:
-            x = int(flake["x"])
-            y = int(flake["y"])
-            size = int(flake["size"])
-            pygame.draw.circle(screen, snow_color, (x, y), size)
\ No newline at end of file
+        if snow_color != self._sprite_color:
+            self._build_atlas(snow_color)
+            self._sprite_color = snow_color
+        atlas = self._atlas
+        xs: List[int] = self.xs.astype(np.intp).tolist()
+        ys: List[int] = self.ys.astype(np.intp).tolist()
+        # Surface.blits rather than blit_sequence: fblits takes no source rect.
+        screen.blits(
+            [(atlas, (x - r, y - r), area) for x, y, r, area in zip(xs, ys, self._radii, self._areas)],
+            doreturn=False,
+        )
\ No newline at end of file
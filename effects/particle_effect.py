@@ -1,13 +1,27 @@
 """
 effects/particle_effect.py - Implements a basic particle effect system.
-Version: 1.2.3
-Summary: Updated to use a gradually updated particle color palette so that theme changes do not reset the particle animation.
+Version: 1.7.0
+Summary: Particles are stored as NumPy arrays instead of a list of Particle objects. The fields the physics
+step touches (position, velocity, lifetime) share one float32 block, one row per field, and the fields only
+drawing needs (initial lifetime, palette index) live in separate arrays. The arrays form a fixed-capacity ring
+buffer sized from PARTICLE_CONFIG: spawns overwrite the oldest slots and nothing is allocated or compacted
+after construction. Only the live window (the ring slots from the oldest live particle up to the head, at most
+two contiguous slices) is stepped and drawn; it is walked oldest first, so newer particles draw on top, and
+expired slots (LIFE <= 0) inside it are skipped with the mask update() leaves in _alive.
+Spawning draws each batch with one NumPy generator call per distribution, and the color palette is an
+(N, 3) uint8 array blended toward the theme palette in one vectorized expression. The blend is skipped on
+frames where it could not change any channel, so a settled palette costs nothing per frame.
+Particles are drawn from pre-rendered sprites cached per (color, alpha bucket) in one blits call; the shape
+drawer for those sprites is picked once from _SPRITE_SHAPES when the effect is created.
+PARTICLE_CONFIG values used every frame are bound to module constants; call refresh_constants() after editing it.
 """
 
+import math
 import pygame
-import random
-from typing import Tuple, List
+import numpy as np
+from typing import Dict, Tuple
 from core.config import Config
+from layers.base_layer import blit_sequence
 
 # CONFIG AREA: Modify these parameters to change particle behavior.
 PARTICLE_CONFIG = {
@@ -20,6 +34,35 @@ PARTICLE_CONFIG = {
     "continuous_spawn_interval": 0.02 # time in seconds between spawns
 }
 
+ALPHA_BUCKET_SHIFT = 4  # Fade alpha is quantized to 256 >> 4 = 16 levels for sprite caching
+SPRITE_CACHE_LIMIT = 512  # Palette blending creates new colors; the cache is cleared past this size
+
+# Hot-path values resolved from PARTICLE_CONFIG once instead of on every update/spawn.
+_GRAVITY = 0.0
+_SPAWN_INTERVAL = 0.0
+_PARTICLES_PER_SPAWN = 0
+_SPEED_RANGE = (0.0, 0.0)
+_SPAWN_LIFETIME = 0.0
+_RING_CAPACITY = 0
+def refresh_constants() -> None:
+    """
+    Rebinds the module-level particle constants from PARTICLE_CONFIG.
+    Version: 1.4.1
+
+    Call this after changing PARTICLE_CONFIG at runtime.
+    """
+    global _GRAVITY, _SPAWN_INTERVAL, _PARTICLES_PER_SPAWN, _SPEED_RANGE, _SPAWN_LIFETIME, _RING_CAPACITY
+    _GRAVITY = PARTICLE_CONFIG["gravity"]
+    _SPAWN_INTERVAL = PARTICLE_CONFIG["continuous_spawn_interval"]
+    _PARTICLES_PER_SPAWN = PARTICLE_CONFIG.get("particles_per_spawn", 10)
+    _SPEED_RANGE = PARTICLE_CONFIG["gentle_speed_range"]
+    _SPAWN_LIFETIME = PARTICLE_CONFIG["default_lifetime"] * PARTICLE_CONFIG["gentle_lifetime_multiplier"]
+    # Enough slots for a full lifetime of continuous spawning, plus 10% headroom.
+    _RING_CAPACITY = max(_PARTICLES_PER_SPAWN,
+                         int(math.ceil(_PARTICLES_PER_SPAWN / _SPAWN_INTERVAL * _SPAWN_LIFETIME * 1.1)))
+
+refresh_constants()
+
 def interpolate_color(color1: Tuple[int, int, int], color2: Tuple[int, int, int], t: float) -> Tuple[int, int, int]:
     """
     Interpolates between two colors.
@@ -31,48 +74,53 @@ def interpolate_color(color1: Tuple[int, int, int], color2: Tuple[int, int, int]
         int(color1[2] + (color2[2] - color1[2]) * t)
     )
 
-def blend_palette(palette1: Tuple[Tuple[int,int,int], ...], palette2: Tuple[Tuple[int,int,int], ...], t: float) -> Tuple[Tuple[int,int,int], ...]:
+def palette_array(palette: Tuple[Tuple[int, int, int], ...]) -> np.ndarray:
     """
-    Blends two palettes (tuples of color tuples) based on t (0.0 to 1.0).
-    Version: 1.2.3
+    Converts a theme palette (tuple of color tuples) to an (N, 3) uint8 array.
+    Version: 1.5.2
+    """
+    return np.array(palette, dtype=np.uint8).reshape(-1, 3)
+
+def blend_palette(palette1: np.ndarray, palette2: np.ndarray, t: float) -> np.ndarray:
+    """
+    Blends two (N, 3) uint8 palettes based on t (0.0 to 1.0), truncating like interpolate_color.
+    Version: 1.5.2
     """
     if len(palette1) == len(palette2):
-        return tuple(interpolate_color(c1, c2, t) for c1, c2 in zip(palette1, palette2))
+        return (palette1 + (palette2.astype(np.float64) - palette1) * t).astype(np.uint8)
     else:
         return palette2
 
-class Particle:
-    def __init__(self, position: Tuple[int, int], velocity: Tuple[float, float],
-                 lifetime: float, color: Tuple[int, int, int], radius: int, shape: str = "circle") -> None:
-        self.position = list(position)
-        self.velocity = list(velocity)
-        self.lifetime = lifetime
-        self.initial_lifetime = lifetime  # store original lifetime for fade calculation
-        self.color = color
-        self.radius = radius
-        self.shape = shape
+# Rows of ParticleEffect.hot, the block the physics step streams through.
+PX, PY, VX, VY, LIFE = range(5)
 
-    def update(self, dt: float) -> None:
-        self.velocity[1] += PARTICLE_CONFIG["gravity"] * dt
-        self.position[0] += self.velocity[0] * dt
-        self.position[1] += self.velocity[1] * dt
-        self.lifetime -= dt
+def _step_particles(hot: np.ndarray, scratch: np.ndarray, gravity: float, dt: float) -> None:
+    """
+    Advances the particles in a hot block by dt in place: gravity, integration and lifetime countdown.
+    Version: 1.7.0
 
-    def draw(self, screen: pygame.Surface) -> None:
-        fade_factor = max(0, min(1, self.lifetime / self.initial_lifetime))
-        alpha = int(255 * fade_factor)
-        if self.shape == "circle":
-            diameter = self.radius * 2
-            temp_surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
-            draw_color = self.color + (alpha,)
-            pygame.draw.circle(temp_surface, draw_color, (self.radius, self.radius), self.radius)
-            screen.blit(temp_surface, (int(self.position[0] - self.radius), int(self.position[1] - self.radius)))
-        elif self.shape == "square":
-            diameter = self.radius * 2
-            temp_surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
-            draw_color = self.color + (alpha,)
-            pygame.draw.rect(temp_surface, draw_color, pygame.Rect(0, 0, diameter, diameter))
-            screen.blit(temp_surface, (int(self.position[0] - self.radius), int(self.position[1] - self.radius)))
+    Parameters:
+        hot (np.ndarray): A (5, n) view of the hot block.
+        scratch (np.ndarray): A (2, n) float32 buffer for the velocity * dt products.
+        gravity (float): Downward acceleration in pixels per second squared.
+        dt (float): Time step in seconds.
+    """
+    hot[VY] += gravity * dt
+    np.multiply(hot[VX:VY + 1], dt, out=scratch)
+    hot[PX:PY + 1] += scratch
+    hot[LIFE] -= dt
+
+def _draw_circle_sprite(sprite: pygame.Surface, color: Tuple[int, int, int, int], radius: int) -> None:
+    pygame.draw.circle(sprite, color, (radius, radius), radius)
+
+def _draw_square_sprite(sprite: pygame.Surface, color: Tuple[int, int, int, int], radius: int) -> None:
+    pygame.draw.rect(sprite, color, pygame.Rect(0, 0, radius * 2, radius * 2))
+
+# Shape name -> function that draws that shape onto a (2r, 2r) sprite. Unknown shapes draw nothing.
+_SPRITE_SHAPES = {
+    "circle": _draw_circle_sprite,
+    "square": _draw_square_sprite,
+}
 
 class ParticleEffect:
     def __init__(self, config: Config, color: Tuple[int, int, int], radius: int, shape: str, particle_count: int,
@@ -86,61 +134,212 @@ class ParticleEffect:
         self.color = color  # Fallback color (unused in spawn; color is chosen from current_palette)
         self.radius = radius
         self.shape = shape
+        self._draw_shape = _SPRITE_SHAPES.get(shape)
         self.particle_count = particle_count  # Deprecated – use config if needed.
         self.lifetime = lifetime
-        self.particles: List[Particle] = []
+        # Particle state as a ring buffer; slots with LIFE <= 0 are free. Hot rows are PX, PY, VX, VY, LIFE.
+        self.capacity = _RING_CAPACITY
+        self.n_live = 0
+        self._head = 0  # Next slot to write
+        self._window = 0  # Slots just before _head that may hold live particles; all others are free
+        self.hot = np.zeros((5, self.capacity), dtype=np.float32)
+        self.init_life = np.ones(self.capacity, dtype=np.float32)
+        self.color_idx = np.zeros(self.capacity, dtype=np.uint8)  # Index into current_palette
+        self._scratch = np.empty((2, self.capacity), dtype=np.float32)
+        self._alive = np.zeros(self.capacity, dtype=bool)  # LIFE > 0, valid inside the live window
+        self._rng = np.random.default_rng()
         self.spawn_rect = spawn_rect
         self.spawn_timer = 0.0
         # Initialize current_palette from the active theme's particle_color_palette
-        self.current_palette = self.config.theme.particle_color_palette
+        self._target_palette = self.config.theme.particle_color_palette
+        self._target_array = palette_array(self._target_palette)
+        self.current_palette = self._target_array
+        self._palette_colors = self._target_palette  # current_palette as tuples, for sprite lookups
+        self._palette_gap = 0  # Largest step a blend could still make; see _measure_palette_gap
         self.palette_transition_duration = 1.0  # seconds
+        self._sprite_cache: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
 
     def spawn_continuous_from_rect(self, rect: pygame.Rect) -> None:
-        count = PARTICLE_CONFIG.get("particles_per_spawn", 10)
+        count = _PARTICLES_PER_SPAWN
         center_x = (rect.left + rect.right) / 2
         center_y = (rect.top + rect.bottom) / 2
         sigma_x = (rect.right - rect.left) / 4
         sigma_y = (rect.bottom - rect.top) / 4
 
-        for _ in range(count):
-            x = random.gauss(center_x, sigma_x)
-            y = random.gauss(center_y, sigma_y)
-            x = max(rect.left, min(x, rect.right))
-            y = max(rect.top, min(y, rect.bottom))
-            position = (x, y)
-            angle = random.uniform(80, 100)
-            speed = random.uniform(*PARTICLE_CONFIG["gentle_speed_range"])
-            velocity_vector = pygame.math.Vector2(1, 0).rotate(angle) * speed
-            # Use the gradually updated current_palette for particle color
-            color = random.choice(self.current_palette)
-            lifetime = PARTICLE_CONFIG["default_lifetime"] * PARTICLE_CONFIG["gentle_lifetime_multiplier"]
-            particle = Particle(
-                position=position,
-                velocity=(velocity_vector.x, velocity_vector.y),
-                lifetime=lifetime,
-                color=color,
-                radius=self.radius,
-                shape=self.shape
-            )
-            self.particles.append(particle)
+        rng = self._rng
+        slots = self._claim_slots(count)
+        hot = self.hot
+        hot[PX, slots] = np.clip(rng.normal(center_x, sigma_x, count), rect.left, rect.right)
+        hot[PY, slots] = np.clip(rng.normal(center_y, sigma_y, count), rect.top, rect.bottom)
+        angle = np.deg2rad(rng.uniform(80, 100, count))
+        speed = rng.uniform(*_SPEED_RANGE, count)
+        hot[VX, slots] = np.cos(angle) * speed
+        hot[VY, slots] = np.sin(angle) * speed
+        hot[LIFE, slots] = _SPAWN_LIFETIME
+        self.init_life[slots] = _SPAWN_LIFETIME
+        # Particles take their color from the gradually updated current_palette
+        self.color_idx[slots] = rng.integers(0, len(self.current_palette), count)
+
+    def _claim_slots(self, count: int) -> np.ndarray:
+        """
+        Claims the next count ring slots, overwriting the oldest particles when the ring is full.
+        Version: 1.6.0
+
+        Parameters:
+            count (int): The number of particles about to be added.
+
+        Returns:
+            np.ndarray: The slot indices to write the new particles into.
+        """
+        slots = (self._head + np.arange(count)) % self.capacity
+        self._head = (self._head + count) % self.capacity
+        self._window = min(self.capacity, self._window + count)
+        self.n_live = min(self.capacity, self.n_live + count)
+        return slots
+
+    def _window_slices(self) -> Tuple[slice, ...]:
+        """
+        Returns the live window as at most two slot slices, oldest particles first.
+        Version: 1.7.0
+
+        Returns:
+            Tuple[slice, ...]: The slices covering the live window in age order.
+        """
+        start = self._head - self._window
+        if start >= 0:
+            return (slice(start, self._head),)
+        return (slice(start + self.capacity, self.capacity), slice(0, self._head))
+
+    def _measure_palette_gap(self) -> int:
+        """
+        Measures how far current_palette is from the target palette.
+        Version: 1.5.3
+
+        blend_palette truncates, so a channel below its target only moves once (target - current) * t
+        reaches 1, while a channel above its target moves on every blend.
+
+        Returns:
+            int: 0 when the palettes match, the largest upward gap when every channel is at or below its
+            target, and 256 (always blend) otherwise.
+        """
+        current = self.current_palette
+        target = self._target_array
+        if len(current) != len(target):
+            return 256
+        diff = target.astype(np.int16) - current
+        if diff.size == 0:
+            return 0
+        if diff.min() < 0:
+            return 256
+        return int(diff.max())
 
     def update(self, dt: float) -> None:
         # Gradually update current_palette toward the active theme's particle_color_palette
         t = min(1.0, dt / self.palette_transition_duration)
-        self.current_palette = blend_palette(self.current_palette, self.config.theme.particle_color_palette, t)
+        target = self.config.theme.particle_color_palette
+        if target is not self._target_palette:
+            self._target_palette = target
+            self._target_array = palette_array(target)
+            self._palette_gap = self._measure_palette_gap()
+        if self._palette_gap * t >= 1:
+            self.current_palette = blend_palette(self.current_palette, self._target_array, t)
+            self._palette_colors = tuple(map(tuple, self.current_palette.tolist()))
+            self._palette_gap = self._measure_palette_gap()
 
         self.spawn_timer += dt
-        if self.spawn_timer >= PARTICLE_CONFIG["continuous_spawn_interval"]:
+        if self.spawn_timer >= _SPAWN_INTERVAL:
             if self.spawn_rect is not None:
                 self.spawn_continuous_from_rect(self.spawn_rect)
             self.spawn_timer = 0.0
-        for particle in self.particles:
-            particle.update(dt)
-        self.particles = [p for p in self.particles if p.lifetime > 0]
+        if self.n_live == 0:
+            return
+        hot = self.hot
+        scratch = self._scratch
+        alive = self._alive
+        n_live = 0
+        expired_front = 0  # Expired slots before the oldest live particle; they leave the window
+        front = True
+        for part in self._window_slices():
+            block = hot[:, part]
+            _step_particles(block, scratch[:, :block.shape[1]], _GRAVITY, dt)
+            part_alive = np.greater(block[LIFE], 0, out=alive[part])
+            count = int(np.count_nonzero(part_alive))
+            if front:
+                if count == part_alive.size:
+                    front = False
+                elif count:
+                    expired_front += int(part_alive.argmax())
+                    front = False
+                else:
+                    expired_front += part_alive.size
+            n_live += count
+        self._window -= expired_front
+        self.n_live = n_live
+
+    def _build_sprite(self, color: Tuple[int, int, int], alpha_bucket: int) -> pygame.Surface:
+        """
+        Renders and caches the sprite for one color at one alpha bucket.
+        Version: 1.4.0
+
+        Parameters:
+            color (Tuple[int, int, int]): The particle color.
+            alpha_bucket (int): The quantized fade level; the sprite uses the top alpha of the bucket.
+
+        Returns:
+            pygame.Surface: The cached sprite.
+        """
+        if len(self._sprite_cache) >= SPRITE_CACHE_LIMIT:
+            self._sprite_cache.clear()
+        radius = self.radius
+        diameter = radius * 2
+        alpha = ((alpha_bucket + 1) << ALPHA_BUCKET_SHIFT) - 1
+        sprite = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        if self._draw_shape is not None:
+            self._draw_shape(sprite, color + (alpha,), radius)
+        self._sprite_cache[(color, alpha_bucket)] = sprite
+        return sprite
 
     def draw(self, screen: pygame.Surface) -> None:
-        for particle in self.particles:
-            particle.draw(screen)
+        if self.n_live == 0:
+            return
+        radius = self.radius
+        parts = self._window_slices()
+        if len(parts) == 1:
+            part = parts[0]
+            hot = self.hot[:, part]
+            init_life = self.init_life[part]
+            color_idx = self.color_idx[part]
+        else:
+            # The window wraps: join both halves, oldest first, so newer particles draw on top.
+            hot = np.concatenate([self.hot[:, part] for part in parts], axis=1)
+            init_life = np.concatenate([self.init_life[part] for part in parts])
+            color_idx = np.concatenate([self.color_idx[part] for part in parts])
+        if self.n_live < self._window:
+            # Skip particles that expired inside the window, using the mask update() left.
+            live = np.concatenate([self._alive[part] for part in parts])
+            hot = hot[:, live]
+            init_life = init_life[live]
+            color_idx = color_idx[live]
+        # Fade factor clamped to [0, 1] in place on the fresh quotient, then scaled to alpha.
+        fade = hot[LIFE] / init_life
+        np.minimum(fade, 1, out=fade)
+        np.maximum(fade, 0, out=fade)
+        fade *= 255
+        buckets = fade.astype(np.int32) >> ALPHA_BUCKET_SHIFT
+        lefts = (hot[PX] - radius).astype(np.int32)
+        tops = (hot[PY] - radius).astype(np.int32)
+        palette = self._palette_colors
+        # Indices wrap in case the palette length changed since the particles were spawned.
+        indices = color_idx % len(palette)
+        cache = self._sprite_cache
+        blit_seq = []
+        for color, bucket, x, y in zip(map(palette.__getitem__, indices.tolist()), buckets.tolist(),
+                                       lefts.tolist(), tops.tolist()):
+            sprite = cache.get((color, bucket))
+            if sprite is None:
+                sprite = self._build_sprite(color, bucket)
+            blit_seq.append((sprite, (x, y)))
+        blit_sequence(screen, blit_seq)
 
 def create_default_continuous_effect(config: Config, spawn_rect: pygame.Rect = None) -> ParticleEffect:
     """
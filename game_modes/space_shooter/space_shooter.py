@@ -2,19 +2,36 @@
 game_modes/space_shooter/space_shooter.py
 --------------------------------------------------------------------------------
 A modular Space Shooter game mode with independent effects, adapted for mouse/touch input.
-Version: 1.4.1
+Version: 1.6.1
 Summary: 
   1) Applies short thrust impulses based on on-screen controls.
   2) Adds the ship's velocity to projectile velocity on firing.
   3) Rotation and thrust are triggered via mouse/touch events.
+  4) Bullets are stored as NumPy position/velocity arrays and advanced and culled with vectorized operations.
+  5) Bullets are drawn from one pre-rendered sprite in a single batched blit.
+  6) The ship is drawn from rotations cached per ROTATION_STEP degrees instead of rotating every frame;
+     the cache is shared by all instances, so re-entering the mode reuses it.
+  7) Thrust and firing directions come from a per-degree (cos, -sin) lookup table.
+  8) Ship position and velocity are NumPy 2-vectors; thrust, friction, integration and screen wrap are
+     whole-vector operations, with the wrap done by modulo instead of per-axis branches.
+  9) Ship and bullet sprites are converted to the display's pixel format once, when they are created.
+  10) The mode label is rendered once per theme font color instead of every frame.
+  11) Ship thrust, friction, integration and wrap run in fixed PHYSICS_STEP substeps fed by an
+      accumulator, so ship motion no longer depends on the frame rate.
 """
 
-import math
 import pygame
+import numpy as np
+from typing import Dict, Optional
 from core.config import Config
+from layers.base_layer import blit_sequence, to_display_format
 from managers.layer_manager import LayerManager
 from plugins.plugins import register_play_mode
 
+# Unit heading vectors (cos θ, -sin θ) for every whole degree; screen y grows downward.
+_HEADING_ANGLES = np.radians(np.arange(360))
+HEADINGS = np.column_stack((np.cos(_HEADING_ANGLES), -np.sin(_HEADING_ANGLES)))
+
 @register_play_mode("Space Shooter")
 class SpaceShooter:
     """
@@ -22,6 +39,15 @@ class SpaceShooter:
     Use on-screen buttons to control rotation, thrust, and firing.
     """
 
+    BULLET_CAPACITY = 32  # Initial bullet array size; doubled whenever it fills up
+    BULLET_RADIUS = 5
+    ROTATION_STEP = 5  # Degrees between cached ship rotations
+    PHYSICS_STEP = 1 / 120  # Seconds per ship physics substep
+    MAX_PHYSICS_STEPS = 8  # Substeps one update may run; longer stalls are dropped instead of replayed
+    # Rotation step index -> rotated ship. Every instance draws the same ship, so the cache is shared and
+    # survives the new instance GameManager creates each time the mode is entered.
+    _rotation_cache: Dict[int, pygame.Surface] = {}
+
     def __init__(self, font: pygame.font.Font, config: Config, layer_manager: LayerManager) -> None:
         """
         Initializes the SpaceShooter game mode with short thrust impulses.
@@ -35,8 +61,8 @@ class SpaceShooter:
         self.layer_manager = layer_manager
 
         # Ship position (center of screen), velocity, and orientation
-        self.spaceship_pos = [config.screen_width // 2, config.screen_height // 2]
-        self.spaceship_vel = [0.0, 0.0]
+        self.spaceship_pos = np.array([config.screen_width // 2, config.screen_height // 2], dtype=np.float64)
+        self.spaceship_vel = np.zeros(2, dtype=np.float64)
         self.spaceship_angle = 0.0
 
         # Toggle booleans for rotation (controlled via on-screen buttons)
@@ -52,12 +78,21 @@ class SpaceShooter:
         self.ROTATION_SPEED = 120.0     # degrees per second
         self.ACCELERATION = 200.0       # px/sec^2
         self.FRICTION_FACTOR = 0.995    # velocity multiplier
+        # FRICTION_FACTOR was tuned per frame at 60 FPS; this is the same decay per physics substep.
+        self._step_friction = self.FRICTION_FACTOR ** (self.PHYSICS_STEP * 60)
+        self._physics_accum = 0.0
+        self._draw_pos = (int(self.spaceship_pos[0]), int(self.spaceship_pos[1]))  # Ship center in whole pixels
 
         # Prepare the spaceship graphic (triangle)
         self.spaceship_surface = self.create_spaceship_surface()
+        self.bullet_surface = self.create_bullet_surface()
+        self._label: Optional[pygame.Surface] = None  # Rendered mode label, rebuilt when the font color changes
+        self._label_color = None
 
-        # Track bullets in-flight
-        self.bullets = []
+        # Track bullets in-flight: rows [0, n_bullets) of the position/velocity arrays are live.
+        self.n_bullets = 0
+        self.bullet_pos = np.empty((self.BULLET_CAPACITY, 2), dtype=np.float32)
+        self.bullet_vel = np.empty((self.BULLET_CAPACITY, 2), dtype=np.float32)
         self.BULLET_SPEED = 300.0
 
     def create_spaceship_surface(self) -> pygame.Surface:
@@ -70,7 +105,42 @@ class SpaceShooter:
         surf = pygame.Surface((width, height), pygame.SRCALPHA)
         points = [(width, height // 2), (0, 0), (0, height)]
         pygame.draw.polygon(surf, (255, 255, 0), points)
-        return surf
+        return to_display_format(surf)
+
+    def create_bullet_surface(self) -> pygame.Surface:
+        """
+        Creates and returns the bullet sprite, matching pygame.draw.circle at the bullet position.
+        Returns:
+            pygame.Surface: A surface with a red circle of BULLET_RADIUS centered at (BULLET_RADIUS, BULLET_RADIUS).
+        """
+        radius = self.BULLET_RADIUS
+        size = radius * 2 + 1
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (255, 0, 0), (radius, radius), radius)
+        return to_display_format(surf)
+
+    def get_rotated_ship(self) -> pygame.Surface:
+        """
+        Returns the ship surface rotated to the nearest ROTATION_STEP degrees of spaceship_angle,
+        rotating and caching it on first use.
+        Returns:
+            pygame.Surface: The rotated ship surface.
+        """
+        steps = 360 // self.ROTATION_STEP
+        key = round(self.spaceship_angle / self.ROTATION_STEP) % steps
+        rotated = self._rotation_cache.get(key)
+        if rotated is None:
+            rotated = pygame.transform.rotate(self.spaceship_surface, key * self.ROTATION_STEP)
+            self._rotation_cache[key] = rotated
+        return rotated
+
+    def heading(self) -> np.ndarray:
+        """
+        Returns the unit vector the ship faces, with spaceship_angle rounded to the nearest degree.
+        Returns:
+            np.ndarray: The (cos θ, -sin θ) row of HEADINGS.
+        """
+        return HEADINGS[round(self.spaceship_angle) % 360]
 
     def on_enter(self) -> None:
         """
@@ -91,48 +161,51 @@ class SpaceShooter:
         elif self.rotating_right and not self.rotating_left:
             self.spaceship_angle -= self.ROTATION_SPEED * dt
 
-        # Apply short forward thrust if timer is active
-        if self.thrust_timer_forward > 0:
-            rad = math.radians(self.spaceship_angle)
-            self.spaceship_vel[0] += math.cos(rad) * self.ACCELERATION * dt
-            self.spaceship_vel[1] -= math.sin(rad) * self.ACCELERATION * dt
-            self.thrust_timer_forward -= dt
+        # Advance the ship in fixed substeps; the leftover time carries over to the next frame
+        step = self.PHYSICS_STEP
+        self._physics_accum = min(self._physics_accum + dt, step * self.MAX_PHYSICS_STEPS)
+        while self._physics_accum >= step:
+            self._physics_step(step)
+            self._physics_accum -= step
+        self._draw_pos = (int(self.spaceship_pos[0]), int(self.spaceship_pos[1]))
+
+        # Update bullets
+        n = self.n_bullets
+        if n:
+            pos = self.bullet_pos[:n]
+            vel = self.bullet_vel[:n]
+            pos += vel * dt
+            # Remove bullets that leave the screen, keeping the survivors packed at the front
+            xs = pos[:, 0]
+            ys = pos[:, 1]
+            on_screen = (xs >= 0) & (xs <= self.config.screen_width) & (ys >= 0) & (ys <= self.config.screen_height)
+            alive = int(np.count_nonzero(on_screen))
+            if alive < n:
+                self.bullet_pos[:alive] = pos[on_screen]
+                self.bullet_vel[:alive] = vel[on_screen]
+                self.n_bullets = alive
 
-        # Apply short reverse thrust if timer is active
+    def _physics_step(self, step: float) -> None:
+        """
+        Advances the ship by one fixed physics substep: thrust, friction, integration and screen wrap.
+        Parameters:
+            step (float): The substep length in seconds (PHYSICS_STEP).
+        """
+        # Apply short forward/reverse thrust while the timers are active
+        thrust = 0
+        if self.thrust_timer_forward > 0:
+            thrust += 1
+            self.thrust_timer_forward -= step
         if self.thrust_timer_reverse > 0:
-            rad = math.radians(self.spaceship_angle)
-            self.spaceship_vel[0] -= math.cos(rad) * self.ACCELERATION * dt
-            self.spaceship_vel[1] += math.sin(rad) * self.ACCELERATION * dt
-            self.thrust_timer_reverse -= dt
-
-        # Apply friction
-        self.spaceship_vel[0] *= self.FRICTION_FACTOR
-        self.spaceship_vel[1] *= self.FRICTION_FACTOR
-
-        # Update position
-        self.spaceship_pos[0] += self.spaceship_vel[0] * dt
-        self.spaceship_pos[1] += self.spaceship_vel[1] * dt
-
-        # Screen wrap
-        if self.spaceship_pos[0] > self.config.screen_width:
-            self.spaceship_pos[0] = 0
-        elif self.spaceship_pos[0] < 0:
-            self.spaceship_pos[0] = self.config.screen_width
-        if self.spaceship_pos[1] > self.config.screen_height:
-            self.spaceship_pos[1] = 0
-        elif self.spaceship_pos[1] < 0:
-            self.spaceship_pos[1] = self.config.screen_height
+            thrust -= 1
+            self.thrust_timer_reverse -= step
+        if thrust:
+            self.spaceship_vel += self.heading() * (thrust * self.ACCELERATION * step)
 
-        # Update bullets
-        for bullet in self.bullets:
-            bullet["pos"][0] += bullet["vel"][0] * dt
-            bullet["pos"][1] += bullet["vel"][1] * dt
-        # Remove bullets that leave the screen
-        self.bullets = [
-            b for b in self.bullets
-            if 0 <= b["pos"][0] <= self.config.screen_width
-               and 0 <= b["pos"][1] <= self.config.screen_height
-        ]
+        # Apply friction, update position and wrap around the screen edges
+        self.spaceship_vel *= self._step_friction
+        self.spaceship_pos += self.spaceship_vel * step
+        np.mod(self.spaceship_pos, (self.config.screen_width, self.config.screen_height), out=self.spaceship_pos)
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -140,35 +213,36 @@ class SpaceShooter:
         Parameters:
             screen (pygame.Surface): The surface on which to draw.
         """
-        rotated_ship = pygame.transform.rotate(self.spaceship_surface, self.spaceship_angle)
-        ship_rect = rotated_ship.get_rect(center=(int(self.spaceship_pos[0]), int(self.spaceship_pos[1])))
+        rotated_ship = self.get_rotated_ship()
+        ship_rect = rotated_ship.get_rect(center=self._draw_pos)
         screen.blit(rotated_ship, ship_rect)
 
-        # Draw bullets (red circles)
-        for bullet in self.bullets:
-            px, py = int(bullet["pos"][0]), int(bullet["pos"][1])
-            pygame.draw.circle(screen, (255, 0, 0), (px, py), 5)
+        # Draw bullets (red circles) in one batched blit
+        if self.n_bullets:
+            bullet = self.bullet_surface
+            corners = self.bullet_pos[:self.n_bullets].astype(np.int32) - self.BULLET_RADIUS
+            blit_sequence(screen, [(bullet, corner) for corner in corners.tolist()])
 
         # Label the mode at top-left
-        label = self.font.render("Space Shooter Mode", True, self.config.theme.font_color)
-        screen.blit(label, (10, 10))
+        color = self.config.theme.font_color
+        if color != self._label_color or self._label is None:
+            self._label = self.font.render("Space Shooter Mode", True, color)
+            self._label_color = color
+        screen.blit(self._label, (10, 10))
 
     def fire(self) -> None:
         """
         Spawns a new bullet whose velocity is the sum of ship velocity and bullet speed 
         in the facing direction.
         """
-        rad = math.radians(self.spaceship_angle)
-        vx = self.BULLET_SPEED * math.cos(rad)
-        vy = -self.BULLET_SPEED * math.sin(rad)
+        n = self.n_bullets
+        if n == len(self.bullet_pos):
+            self.bullet_pos = np.concatenate((self.bullet_pos, np.empty_like(self.bullet_pos)))
+            self.bullet_vel = np.concatenate((self.bullet_vel, np.empty_like(self.bullet_vel)))
+        self.bullet_pos[n] = self.spaceship_pos
         # Inherit current ship velocity
-        vx += self.spaceship_vel[0]
-        vy += self.spaceship_vel[1]
-        bullet = {
-            "pos": [self.spaceship_pos[0], self.spaceship_pos[1]],
-            "vel": [vx, vy]
-        }
-        self.bullets.append(bullet)
+        self.bullet_vel[n] = self.heading() * self.BULLET_SPEED + self.spaceship_vel
+        self.n_bullets = n + 1
 
     def on_input(self, event: pygame.event.Event) -> None:
         """
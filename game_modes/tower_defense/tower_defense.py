@@ -1,7 +1,8 @@
 """
 tower_defense.py - A blank template for a Tower Defense game mode.
-Version: 1.0.0
+Version: 1.0.1
 Summary: Registers a new game mode called "Tower Defense" that integrates with the GameManager and PlayAreaLayer.
+         The mode label is rendered once per theme font color instead of every frame.
 """
 
 import pygame
@@ -24,6 +25,8 @@ class TowerDefense:
         self.font = font
         self.config = config
         self.layer_manager = layer_manager
+        self._label = None  # Rendered mode label, rebuilt when the theme's font color changes
+        self._label_color = None
 
     def on_enter(self) -> None:
         """
@@ -42,11 +45,14 @@ class TowerDefense:
     def draw(self, screen: pygame.Surface) -> None:
         """
         Draws the game onto the screen.
-        Version: 1.0.0
-        """
-        text = self.font.render("Tower Defense Mode", True, self.config.theme.font_color)
-        rect = text.get_rect(center=(self.config.screen_width // 2, self.config.screen_height // 2))
-        screen.blit(text, rect)
+        Version: 1.0.1
+        """
+        color = self.config.theme.font_color
+        if color != self._label_color or self._label is None:
+            self._label = self.font.render("Tower Defense Mode", True, color)
+            self._label_color = color
+        rect = self._label.get_rect(center=(self.config.screen_width // 2, self.config.screen_height // 2))
+        screen.blit(self._label, rect)
 
     def on_input(self, event: pygame.event.Event) -> None:
         """
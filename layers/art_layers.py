@@ -2,19 +2,50 @@
 art_layers.py
 -------------
 Provides art layers for universal background and foreground art.
-Version: 1.3.0
+Version: 1.6.2
+Summary: Art lines are stretched and rendered once per screen size / text color. While the color
+         keeps changing (theme blends) the rendered lines are blitted directly in one batched call;
+         once the color has held for a frame they are composited into one screen-sized surface and
+         each frame is a single blit of that composite.
+         Both art layers share this pipeline through _AsciiArtLayer and use __slots__; each passes
+         in the layout function that places its lines.
 """
 
 import pygame
 import math
-from typing import List
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
 from assets.art_assets import STAR_ART, BACKGROUND_ART
-from .base_layer import BaseLayer
+from .base_layer import BaseLayer, blit_sequence, to_display_format
 from ui.layout_constants import ArtLayout, LayerZIndex
 from core.config import Config
 from plugins.plugins import register_layer
 
-def stretch_line(line: str, font: pygame.font.Font, target_width: int) -> str:
+# Measured text widths per font; entries go away with the font they were measured with.
+_text_widths: "weakref.WeakKeyDictionary[pygame.font.Font, Dict[str, int]]" = weakref.WeakKeyDictionary()
+
+def text_width(font: pygame.font.Font, text: str) -> int:
+    """
+    Returns the rendered width of the text, measuring it only once per font.
+
+    Parameters:
+        font (pygame.font.Font): The pygame font used to measure text width.
+        text (str): The text to measure.
+
+    Returns:
+        int: The width in pixels.
+    """
+    widths = _text_widths.get(font)
+    if widths is None:
+        widths = _text_widths[font] = {}
+    width = widths.get(text)
+    if width is None:
+        width = widths[text] = font.size(text)[0]
+    return width
+
+def stretch_line(
+    line: str, font: pygame.font.Font, target_width: int, space_width: Optional[int] = None
+) -> str:
     """
     Inserts extra spaces between characters to stretch the line horizontally.
 
@@ -22,42 +53,149 @@ def stretch_line(line: str, font: pygame.font.Font, target_width: int) -> str:
         line (str): The original string to stretch.
         font (pygame.font.Font): The pygame font used to measure text width.
         target_width (int): The desired width in pixels.
+        space_width (Optional[int]): Width of a space in this font; measured when omitted.
 
     Returns:
         str: The stretched string.
     """
-    current_width: int = font.size(line)[0]
+    current_width: int = text_width(font, line)
     if current_width >= target_width:
         return line
     gaps: int = len(line) - 1
     if gaps <= 0:
         return line
-    space_width: int = font.size(" ")[0]
+    if space_width is None:
+        space_width = text_width(font, " ")
     extra_spaces: int = math.ceil((target_width - current_width) / (gaps * space_width))
-    new_line: str = line[0]
-    for char in line[1:]:
-        new_line += " " * extra_spaces + char
-    return new_line
+    return (" " * extra_spaces).join(line)
 
-@register_layer("star_art", "background")
-class StarArtLayer(BaseLayer):
+def new_text_composite(size: Tuple[int, int], color: Tuple[int, int, int]) -> pygame.Surface:
     """
-    Layer for displaying star art in the background.
+    Creates a transparent surface for compositing text rendered in a single color.
+    The transparent pixels carry the text color so antialiased edges keep their color
+    when blended into the composite.
+
+    Parameters:
+        size (Tuple[int, int]): The size of the composite surface.
+        color (Tuple[int, int, int]): The text color.
+
+    Returns:
+        pygame.Surface: The empty composite surface.
     """
-    def __init__(self, font: pygame.font.Font, config: Config) -> None:
+    composite = pygame.Surface(size, pygame.SRCALPHA)
+    composite.fill((*color, 0))
+    return composite
+
+def finish_text_composite(composite: pygame.Surface) -> pygame.Surface:
+    """
+    Converts a finished composite to the display's pixel format and enables RLE
+    acceleration. The art is mostly transparent, so run-length encoding lets SDL skip
+    the empty runs instead of blending every pixel of a screen-sized surface each frame.
+
+    Parameters:
+        composite (pygame.Surface): The composite returned by new_text_composite.
+
+    Returns:
+        pygame.Surface: The surface to blit every frame.
+    """
+    composite = to_display_format(composite)
+    composite.set_alpha(255, pygame.RLEACCEL)
+    return composite
+
+# Places art lines for a screen size: (font, config, art, screen_width, screen_height) -> (lines, center ys).
+ArtLayoutFunc = Callable[[pygame.font.Font, Config, Tuple[str, ...], int, int], Tuple[List[str], List[int]]]
+
+def star_art_layout(
+    font: pygame.font.Font, config: Config, art: Tuple[str, ...], screen_width: int, screen_height: int
+) -> Tuple[List[str], List[int]]:
+    """
+    Stretches the star art to the screen width and spaces the lines between the scaled
+    top and bottom margins.
+
+    Parameters:
+        font (pygame.font.Font): The pygame font used to measure text width.
+        config (Config): The configuration object containing the scale.
+        art (Tuple[str, ...]): The lines of art.
+        screen_width (int): The current screen width.
+        screen_height (int): The current screen height.
+
+    Returns:
+        Tuple[List[str], List[int]]: The stretched lines and the center y of each line.
+    """
+    space_width: int = text_width(font, " ")
+    lines: List[str] = [stretch_line(line, font, screen_width, space_width) for line in art]
+    margin: int = config.scale_value(ArtLayout.STAR_MARGIN_FACTOR)  # Top and bottom
+    available_height: int = screen_height - 2 * margin
+    num_lines: int = len(lines)
+    spacing: float = available_height / (num_lines - 1) if num_lines > 1 else available_height
+    return lines, [int(margin + i * spacing) for i in range(num_lines)]
+
+def background_art_layout(
+    font: pygame.font.Font, config: Config, art: Tuple[str, ...], screen_width: int, screen_height: int
+) -> Tuple[List[str], List[int]]:
+    """
+    Stacks the background art lines downwards from the vertical center of the screen.
+
+    Parameters:
+        font (pygame.font.Font): The pygame font whose line height spaces the lines.
+        config (Config): The configuration object (unused; part of the layout signature).
+        art (Tuple[str, ...]): The lines of art.
+        screen_width (int): The current screen width.
+        screen_height (int): The current screen height.
+
+    Returns:
+        Tuple[List[str], List[int]]: The lines and the center y of each line.
+    """
+    top: int = int(screen_height * 0.5)
+    line_height: int = font.get_height()
+    return list(art), [top + i * line_height for i in range(len(art))]
+
+class _AsciiArtLayer(BaseLayer):
+    """
+    Shared pipeline for layers that draw ASCII art in a single theme color. Subclasses
+    provide the art, the theme color attribute and the layout function. The lines are
+    re-rendered only when the screen size or the color changes, or when the layer is
+    marked dirty, and are merged into one cached composite once the color is stable.
+    Set dirty to True to force the lines to be re-rendered on the next draw.
+    """
+    __slots__ = (
+        "z", "font", "config", "art", "_layout", "_empty", "line_height", "dirty",
+        "_layout_size", "_lines", "_ys", "_lines_key", "_line_blits", "_composite",
+    )
+    color_attr: str  # Name of the Theme attribute holding the text color.
+    persistent = True  # Mark as persistent so it does not dim during transitions
+    UPDATE_IS_NOOP = True  # Static; LayerManager skips update()
+
+    def __init__(
+        self, font: pygame.font.Font, config: Config, art: Tuple[str, ...], layout: ArtLayoutFunc, z: int
+    ) -> None:
         """
-        Initializes the StarArtLayer with the provided font and configuration.
+        Initializes the shared art layer state.
 
         Parameters:
             font (pygame.font.Font): The pygame font used for rendering.
             config (Config): The configuration object containing screen dimensions and scale.
+            art (Tuple[str, ...]): The lines of art to draw.
+            layout (ArtLayoutFunc): Places the lines for a screen size.
+            z (int): The layer's z-index.
         """
-        self.z: int = LayerZIndex.STAR_ART
+        self.z: int = z
         self.font: pygame.font.Font = font
         self.config: Config = config
-        self.art: List[str] = STAR_ART
+        self.art: Tuple[str, ...] = art
+        self._layout: ArtLayoutFunc = layout
+        self._empty: bool = not self.art  # Nothing to draw; draw() returns immediately.
         self.line_height: int = self.font.get_height()
-        self.persistent: bool = True  # Mark as persistent so it does not dim during transitions
+        self.dirty: bool = True  # Forces a re-render on the next draw; cleared by draw()
+        # Layout (lines and their y positions) only depends on the screen size.
+        self._layout_size: Optional[Tuple[int, int]] = None
+        self._lines: List[str] = []
+        self._ys: List[int] = []
+        # Rendered lines with their top-left positions, for the screen size and color in _lines_key.
+        self._lines_key: Optional[Tuple[int, int, Tuple[int, int, int]]] = None
+        self._line_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        # Composite of the rendered lines; None until they have been drawn for a frame unchanged.
+        self._composite: Optional[pygame.Surface] = None
 
     def update(self, dt: float) -> None:
         """
@@ -68,74 +206,95 @@ class StarArtLayer(BaseLayer):
         """
         pass
 
+    def _render_lines(self, color: Tuple[int, int, int]) -> None:
+        """
+        Renders every line of art and computes where each one is blitted.
+        The layout is only redone when the screen size changes; a color change just re-renders.
+
+        Parameters:
+            color (Tuple[int, int, int]): The color used to render the text.
+        """
+        screen_width: int = self.config.screen_width
+        screen_height: int = self.config.screen_height
+        if (screen_width, screen_height) != self._layout_size:
+            self._lines, self._ys = self._layout(self.font, self.config, self.art, screen_width, screen_height)
+            self._layout_size = (screen_width, screen_height)
+        center_x: int = screen_width // 2
+        render = self.font.render
+        line_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        for line, y in zip(self._lines, self._ys):
+            text_surface: pygame.Surface = render(line, True, color)
+            line_blits.append((text_surface, text_surface.get_rect(center=(center_x, y)).topleft))
+        self._line_blits = line_blits
+
+    def _build_composite(self, color: Tuple[int, int, int]) -> None:
+        """
+        Composites the rendered lines into one screen-sized surface.
+
+        Parameters:
+            color (Tuple[int, int, int]): The color the lines were rendered in.
+        """
+        composite = new_text_composite((self.config.screen_width, self.config.screen_height), color)
+        blit_sequence(composite, self._line_blits)
+        self._composite = finish_text_composite(composite)
+
     def draw(self, screen: pygame.Surface) -> None:
         """
-        Draws the star art onto the provided screen.
+        Draws the art onto the provided screen.
 
         Parameters:
-            screen (pygame.Surface): The surface on which to draw the star art.
+            screen (pygame.Surface): The surface on which to draw the art.
         """
-        # Read from the theme's star_text_color
-        star_color = self.config.theme.star_text_color
-
-        top_margin: int = self.config.scale_value(ArtLayout.STAR_MARGIN_FACTOR)
-        bottom_margin: int = self.config.scale_value(ArtLayout.STAR_MARGIN_FACTOR)
-        available_height: int = self.config.screen_height - top_margin - bottom_margin
-        num_lines: int = len(self.art)
-        spacing: float = available_height / (num_lines - 1) if num_lines > 1 else available_height
-        for i, line in enumerate(self.art):
-            stretched_line: str = stretch_line(line, self.font, self.config.screen_width)
-            y: float = top_margin + i * spacing
-            text_surface: pygame.Surface = self.font.render(stretched_line, True, star_color)
-            text_rect: pygame.Rect = text_surface.get_rect(
-                center=(self.config.screen_width // 2, int(y))
-            )
-            screen.blit(text_surface, text_rect)
+        if self._empty:
+            return
+        config = self.config
+        color = getattr(config.theme, self.color_attr)
+        key = (config.screen_width, config.screen_height, color)
+        if self.dirty or key != self._lines_key:
+            # The size or color changed. During a theme blend this happens every frame, so the
+            # lines are blitted directly rather than paying for a composite that is used once.
+            self._render_lines(color)
+            self._lines_key = key
+            self._composite = None
+            self.dirty = False
+            blit_sequence(screen, self._line_blits)
+            return
+        if self._composite is None:
+            self._build_composite(color)
+        screen.blit(self._composite, (0, 0))
 
-@register_layer("background_art", "background")
-class BackGroundArtLayer(BaseLayer):
+@register_layer("star_art", "background")
+class StarArtLayer(_AsciiArtLayer):
     """
-    Layer for displaying background art in the background.
+    Layer for displaying star art in the background.
     """
+    __slots__ = ()
+    color_attr = "star_text_color"
+
     def __init__(self, font: pygame.font.Font, config: Config) -> None:
         """
-        Initializes the BackGroundArtLayer with the provided font and configuration.
+        Initializes the StarArtLayer with the provided font and configuration.
 
         Parameters:
             font (pygame.font.Font): The pygame font used for rendering.
             config (Config): The configuration object containing screen dimensions and scale.
         """
-        self.z: int = LayerZIndex.BACKGROUND_ART
-        self.font: pygame.font.Font = font
-        self.config: Config = config
-        self.art: List[str] = BACKGROUND_ART
-        self.line_height: int = self.font.get_height()
-        self.persistent: bool = True  # Mark as persistent so it does not dim during transitions
-
-    def update(self, dt: float) -> None:
-        """
-        Updates the layer. No dynamic behavior implemented.
+        super().__init__(font, config, STAR_ART, star_art_layout, LayerZIndex.STAR_ART)
 
-        Parameters:
-            dt (float): Delta time in seconds.
-        """
-        pass
+@register_layer("background_art", "background")
+class BackGroundArtLayer(_AsciiArtLayer):
+    """
+    Layer for displaying background art in the background.
+    """
+    __slots__ = ()
+    color_attr = "background_text_color"
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def __init__(self, font: pygame.font.Font, config: Config) -> None:
         """
-        Draws the background art onto the provided screen.
+        Initializes the BackGroundArtLayer with the provided font and configuration.
 
         Parameters:
-            screen (pygame.Surface): The surface on which to draw the background art.
+            font (pygame.font.Font): The pygame font used for rendering.
+            config (Config): The configuration object containing screen dimensions and scale.
         """
-        # Read from the theme's background_text_color
-        bg_color = self.config.theme.background_text_color
-
-        y: int = int(self.config.screen_height * 0.5)
-        for line in self.art:
-            text_surface: pygame.Surface = self.font.render(line, True, bg_color)
-            text_rect: pygame.Rect = text_surface.get_rect(
-                center=(self.config.screen_width // 2, y)
-            )
-            screen.blit(text_surface, text_rect)
-            y += self.line_height
\ No newline at end of file
+        super().__init__(font, config, BACKGROUND_ART, background_art_layout, LayerZIndex.BACKGROUND_ART)
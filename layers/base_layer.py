@@ -1,18 +1,42 @@
 """
-base_layer.py - Abstract base class for all layers.
+base_layer.py - Base class for all layers.
 """
 
-from abc import ABC, abstractmethod
+from typing import Sequence, Tuple
 import pygame
 
-class BaseLayer(ABC):
+def blit_sequence(screen: pygame.Surface, blit_seq: Sequence[Tuple[pygame.Surface, Tuple[int, int]]]) -> None:
+    """
+    Blits a sequence of (surface, position) pairs in a single call.
+    Uses Surface.fblits where available (pygame-ce) and falls back to Surface.blits.
+    """
+    fblits = getattr(screen, "fblits", None)
+    if fblits is not None:
+        fblits(blit_seq)
+    else:
+        screen.blits(blit_seq, doreturn=False)
+
+def to_display_format(surf: pygame.Surface) -> pygame.Surface:
+    """
+    Converts a per-pixel-alpha surface to the display's pixel format so blits take SDL's fast path.
+    Returns the surface unchanged when no display mode has been set yet.
+    """
+    if pygame.display.get_surface() is not None:
+        return surf.convert_alpha()
+    return surf
+
+class BaseLayer:
+    # Lets subclasses opt into __slots__; subclasses without them keep a __dict__. The class-level
+    # defaults below are read-only on slotted subclasses, so those must list any they set per instance.
+    __slots__ = ()
     z: int
     persistent: bool = False  # New attribute to mark persistent layers
+    UPDATE_IS_NOOP: bool = False  # True if update() does nothing; LayerManager then never calls it
 
     def update(self, dt: float) -> None:
         # Default no-op update method. Subclasses can override this if dynamic behavior is needed.
         pass
 
-    @abstractmethod
     def draw(self, screen: pygame.Surface) -> None:
-        pass
\ No newline at end of file
+        # Every layer must draw itself. A plain class (no ABCMeta) keeps layer creation cheap.
+        raise NotImplementedError(f"{type(self).__name__} must implement draw()")
\ No newline at end of file
@@ -2,10 +2,12 @@
 border_layer.py
 ---------------
 Provides the border layer that draws a border around the screen.
-Version: 1.2.0
+Version: 1.3.3
+Summary: The border's edge rectangles are computed once per screen size and filled directly each frame.
 """
 
 import pygame
+from typing import List, Optional, Tuple
 from .base_layer import BaseLayer
 from ui.layout_constants import BorderLayout, LayerZIndex
 from core.config import Config
@@ -13,6 +15,13 @@ from plugins.plugins import register_layer
 
 @register_layer("border", "foreground")
 class BorderLayer(BaseLayer):
+    __slots__ = (
+        "font", "config", "z", "_edges", "_color_key", "_mapped_color",
+        "__weakref__",  # For the resize listener
+    )
+    persistent = True  # Remain visible through transitions
+    UPDATE_IS_NOOP = True  # Static; LayerManager skips update()
+
     def __init__(self, font: pygame.font.Font, config: Config) -> None:
         """
         Initializes the BorderLayer with the provided font and configuration.
@@ -25,21 +34,47 @@ class BorderLayer(BaseLayer):
         self.font: pygame.font.Font = font
         self.config: Config = config
         self.z: int = LayerZIndex.BORDER
-        self.persistent: bool = True  # Remain visible through transitions
+        # Top, bottom, left and right edges, rebuilt only when the screen size changes.
+        self._edges: List[pygame.Rect] = []
+        self._build_edges()
+        self.config.add_resize_listener(self._build_edges)
+        # Theme color mapped to the screen's pixel format, refreshed when either changes.
+        self._color_key: Optional[Tuple[Tuple[int, int, int], pygame.Surface]] = None
+        self._mapped_color: int = 0
 
     def update(self, dt: float) -> None:
         pass
 
+    def _build_edges(self) -> None:
+        """
+        Computes the four edge rectangles covering the same pixels as
+        pygame.draw.rect(screen, color, (0, 0, width, height), thickness).
+        """
+        width: int = self.config.screen_width
+        height: int = self.config.screen_height
+        thickness: int = self.config.scale_value(BorderLayout.THICKNESS_FACTOR)
+        if thickness <= 0:
+            # draw.rect treats a width of 0 as a filled rectangle.
+            self._edges = [pygame.Rect(0, 0, width, height)]
+        else:
+            self._edges = [
+                pygame.Rect(0, 0, width, thickness),
+                pygame.Rect(0, height - thickness, width, thickness),
+                pygame.Rect(0, thickness, thickness, height - 2 * thickness),
+                pygame.Rect(width - thickness, thickness, thickness, height - 2 * thickness),
+            ]
+
     def draw(self, screen: pygame.Surface) -> None:
         """
         Draws the border using the current theme's border color.
         Reads the color each time to allow dynamic updates when the theme changes.
         """
-        thickness: int = self.config.scale_value(BorderLayout.THICKNESS_FACTOR)
         color = self.config.theme.border_color  # read dynamically from the theme
-        pygame.draw.rect(
-            screen,
-            color,
-            (0, 0, self.config.screen_width, self.config.screen_height),
-            thickness,
-        )
\ No newline at end of file
+        key = (color, screen)
+        if key != self._color_key:
+            self._mapped_color = screen.map_rgb(color)
+            self._color_key = key
+        mapped_color = self._mapped_color
+        fill = screen.fill
+        for edge in self._edges:
+            fill(mapped_color, edge)
\ No newline at end of file
@@ -3,10 +3,12 @@
 """
 layers/directional_button_layer.py - Provides a directional button layer for game area control.
 --------------------------------------------------------------------------------
-Version: 1.3.14
+Version: 1.3.15
 Summary:
   - All buttons (directional + A/B) now highlight on mouse-down, then call callback on mouse-up if still inside.
   - Ensures the user actually sees the highlight for the B button, even if it triggers a scene change.
+  - on_input dispatches through a per-event-type table; hit areas are computed once at construction, and
+    mouse motion (which never changes button state) returns immediately.
 """
 
 import pygame
@@ -18,6 +20,8 @@ from plugins.plugins import register_layer
 
 @register_layer("directional_button_layer", "game_controls")
 class DirectionalButtonLayer(BaseLayer):
+    UPDATE_IS_NOOP = True  # Static; LayerManager skips update()
+
     def __init__(self, font: pygame.font.Font, config: Config, callback: Callable[[str, bool], None]) -> None:
         """
         Initializes the DirectionalButtonLayer.
@@ -117,6 +121,17 @@ class DirectionalButtonLayer(BaseLayer):
         # Define hit inflation factor (20% larger hit area).
         self.hit_inflation = 0.2
 
+        # Hit areas, computed once: inflated rects for the pad and a radius for the action buttons.
+        inflation = self.button_size * self.hit_inflation
+        self._hit_rects = {direction: rect.inflate(inflation, inflation) for direction, rect in self.buttons.items()}
+        self._action_hit_radius = (self.action_button_size / 2) * (1 + self.hit_inflation)
+
+        # Event type -> handler. Other event types (including MOUSEMOTION) do not affect the buttons.
+        self._event_handlers = {
+            pygame.MOUSEBUTTONDOWN: self._on_press,
+            pygame.MOUSEBUTTONUP: self._on_release,
+        }
+
     def update(self, dt: float) -> None:
         """
         Update method (no periodic updates needed for static pad).
@@ -152,56 +167,62 @@ class DirectionalButtonLayer(BaseLayer):
     def on_input(self, event: pygame.event.Event) -> bool:
         """
         Handles mouse/touch events for directional and action buttons.
-        Version: 1.3.14
+        Version: 1.3.15
         Returns True if the event was handled, False otherwise.
         """
+        handler = self._event_handlers.get(event.type)
+        if handler is None:
+            return False
+        return handler(event.pos)
+
+    def _action_hit(self, key: str, pos) -> bool:
+        """
+        Returns True if pos lies within the inflated hit circle of action button key.
+        Version: 1.3.15
+        """
+        center = self.action_buttons[key]["center"]
+        return math.hypot(pos[0] - center[0], pos[1] - center[1]) <= self._action_hit_radius
+
+    def _on_press(self, pos) -> bool:
+        """
+        Highlights every button under a mouse-down position.
+        Version: 1.3.15
+        Returns True if any button was pressed.
+        """
+        handled = False
+        # 1) Directional buttons: highlight on down.
+        for direction, hit_rect in self._hit_rects.items():
+            if hit_rect.collidepoint(pos):
+                self.pressed[direction] = True
+                handled = True
+        # 2) Action buttons (A/B): same.
+        for key in self.action_buttons:
+            if self._action_hit(key, pos):
+                self.action_pressed[key] = True
+                handled = True
+        return handled
+
+    def _on_release(self, pos) -> bool:
+        """
+        Releases pressed buttons, calling the callback for those still under the mouse-up position.
+        Version: 1.3.15
+        Returns True if any pressed button was released.
+        """
         handled = False
-        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
-            pos = event.pos
-
-            # 1) Directional buttons: highlight on down, callback on up (if still inside).
-            for direction, rect in self.buttons.items():
-                inflated_rect = rect.inflate(
-                    self.button_size * self.hit_inflation,
-                    self.button_size * self.hit_inflation
-                )
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if inflated_rect.collidepoint(pos):
-                        self.pressed[direction] = True
-                        handled = True
-
-                elif event.type == pygame.MOUSEBUTTONUP:
-                    # If we were pressed, check if we're still inside
-                    if self.pressed[direction]:
-                        self.pressed[direction] = False
-                        if inflated_rect.collidepoint(pos):
-                            self.callback(direction, True)  # Callback on release
-                        handled = True
-
-            # 2) Action buttons (A/B): same "highlight on down, fire callback on up if still inside".
-            for key, info in self.action_buttons.items():
-                center = info["center"]
-                dx = pos[0] - center[0]
-                dy = pos[1] - center[1]
-                distance = math.hypot(dx, dy)
-                effective_radius = (self.action_button_size / 2) * (1 + self.hit_inflation)
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if distance <= effective_radius:
-                        self.action_pressed[key] = True
-                        handled = True
-
-                elif event.type == pygame.MOUSEBUTTONUP:
-                    if self.action_pressed[key]:
-                        self.action_pressed[key] = False
-                        if distance <= effective_radius:
-                            self.callback(key, True)
-                        handled = True
-
-            if handled:
-                return True
-
-        return False
+        # 1) Directional buttons: callback on up (if still inside).
+        for direction, hit_rect in self._hit_rects.items():
+            if self.pressed[direction]:
+                self.pressed[direction] = False
+                if hit_rect.collidepoint(pos):
+                    self.callback(direction, True)  # Callback on release
+                handled = True
+        # 2) Action buttons (A/B): same "fire callback on up if still inside".
+        for key in self.action_buttons:
+            if self.action_pressed[key]:
+                self.action_pressed[key] = False
+                if self._action_hit(key, pos):
+                    self.callback(key, True)
+                handled = True
+        return handled
 
 # End of layers/directional_button_layer.py
\ No newline at end of file
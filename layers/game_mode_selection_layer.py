@@ -13,6 +13,8 @@ from ui.layout_constants import LayerZIndex, ButtonLayout, TitleLayout
 from managers.scene_manager import SceneManager
 
 class GameModeSelectionLayer(BaseLayer):
+    UPDATE_IS_NOOP = True  # Static; LayerManager skips update()
+
     def __init__(self, font: pygame.font.Font, config: Config, layer_manager, scene_manager: SceneManager, parent_scene, initial_selected_index: int = 0) -> None:
         """
         Initializes the GameModeSelectionLayer with standardized constructor signature.
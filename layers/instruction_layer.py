@@ -1,10 +1,12 @@
 """
 layers/instruction_layer.py - Provides the instruction layer that displays on-screen instructions.
-Version: 1.2 (updated)
+Version: 1.3.1
+Summary: The instruction text is rendered once per theme color and its position is recomputed only on resize.
+         Attributes live in __slots__.
 """
 
 import pygame
-from typing import Any
+from typing import Any, Optional, Tuple
 from .base_layer import BaseLayer
 from ui.layout_constants import LayerZIndex, InstructionLayout
 from core.config import Config
@@ -12,6 +14,12 @@ from plugins.plugins import register_layer  # New import for universal layer reg
 
 @register_layer("instruction", "foreground")
 class InstructionLayer(BaseLayer):
+    __slots__ = (
+        "z", "font", "config", "text", "color", "_text_surface", "_text_color", "_position",
+        "__weakref__",  # For the resize listener
+    )
+    UPDATE_IS_NOOP = True  # Static; LayerManager skips update()
+
     def __init__(self, font: pygame.font.Font, config: Config) -> None:
         """
         Initializes the InstructionLayer with the provided font and configuration.
@@ -25,6 +33,21 @@ class InstructionLayer(BaseLayer):
         self.config: Config = config
         self.text: str = "Click buttons to navigate and select options."  # Updated instruction text
         self.color: Any = self.config.theme.instruction_color
+        # Rendered text, rebuilt only when the theme's instruction color changes.
+        self._text_surface: Optional[pygame.Surface] = None
+        self._text_color: Any = None
+        # Screen position of the text, refreshed by _on_resize() when the screen size changes.
+        self._position: Tuple[int, int] = (0, 0)
+        self._on_resize()
+        self.config.add_resize_listener(self._on_resize)
+
+    def _on_resize(self) -> None:
+        """
+        Recomputes the text position from the current screen size and scale.
+        """
+        left_margin: int = self.config.scale_value(InstructionLayout.LEFT_MARGIN_PX)
+        bottom_margin: int = self.config.scale_value(InstructionLayout.BOTTOM_MARGIN_PX)
+        self._position = (left_margin, self.config.screen_height - bottom_margin)
 
     def update(self, dt: float) -> None:
         """Updates the instruction layer. No dynamic behavior implemented."""
@@ -37,9 +60,10 @@ class InstructionLayer(BaseLayer):
         Parameters:
             screen: The pygame Surface on which to draw the instructions.
         """
-        left_margin: int = self.config.scale_value(InstructionLayout.LEFT_MARGIN_PX)
-        bottom_margin: int = self.config.scale_value(InstructionLayout.BOTTOM_MARGIN_PX)
-        text_surface: pygame.Surface = self.font.render(self.text, True, self.config.theme.instruction_color)
-        screen.blit(text_surface, (left_margin, self.config.screen_height - bottom_margin))
+        color = self.config.theme.instruction_color
+        if color != self._text_color or self._text_surface is None:
+            self._text_surface = self.font.render(self.text, True, color)
+            self._text_color = color
+        screen.blit(self._text_surface, self._position)
 
 # End of layers/instruction_layer.py
\ No newline at end of file
@@ -14,6 +14,8 @@ from plugins.plugins import register_layer
 
 @register_layer("menu_layer", "menu_only")
 class MenuLayer(BaseLayer):
+    UPDATE_IS_NOOP = True  # Static; LayerManager skips update()
+
     def __init__(self, font: pygame.font.Font, config: Config, scene_manager: SceneManager, menu_items: List[Tuple[str, str]], initial_selected_index: int = 0) -> None:
         """
         Initializes the MenuLayer with standardized constructor signature.
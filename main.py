@@ -1,7 +1,7 @@
 """
 main.py - Main entry point for the application.
 --------------------------------------------------------------------------------
-Version: 1.5.3
+Version: 1.5.4
 Summary: Initializes pygame, loads plugins, creates managers, and registers scenes.
          Now uses mouse/touch-only input for scene navigation and game control.
 """
@@ -73,11 +73,7 @@ scene_manager.set_scene("menu")
 running = True
 while running:
     dt = clock.tick(config.fps) / 1000.0  # Delta time in seconds.
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
-            input_manager.process_event(event)
+    running = input_manager.process_frame()
     scene_manager.update(dt)
     scene_manager.draw(screen)
     pygame.display.flip()
@@ -1,17 +1,23 @@
 """
 managers/input_manager.py - Provides a dedicated InputManager for handling and dispatching mouse/touch events using a clean pipeline.
-Version: 1.4.2
-Summary: Processes events by dispatching only mouse events (MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION).
+Version: 1.5.3
+Summary: Dispatches mouse events (MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION) through a table from event type
+to the bound on_input methods interested in it. The table is built at registration; handlers may narrow the
+types they receive with an EVENT_TYPES attribute. process_frame() drains and dispatches a frame's events in one pass.
+Event types no handler consumes (besides QUIT) are blocked in SDL so they never reach Python.
 """
 
 import pygame
-from typing import List
+from typing import Callable, Dict, List, Optional
 from pygame.event import Event
-from core.interfaces import IInputHandler  # Removed IGlobalInputHandler as it does not exist.
+from core.interfaces import InputHandler
 from core.config import Config
 
-# Define the input handler type using only IInputHandler.
-InputHandlerType = IInputHandler
+# Handlers subclass InputHandler, so every registered handler has an on_input method.
+InputHandlerType = InputHandler
+
+# Event types dispatched to handlers that do not declare EVENT_TYPES.
+DEFAULT_EVENT_TYPES = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
 
 class InputManager:
     def __init__(self, config: Config) -> None:
@@ -23,13 +29,41 @@ class InputManager:
         """
         self.config = config
         self.handlers: List[InputHandlerType] = []
+        # Event type -> bound on_input methods interested in it, in registration order.
+        self._by_type: Dict[int, List[Callable[[Event], Optional[bool]]]] = {}
+
+    def _refresh_methods(self) -> None:
+        """
+        Rebuilds the dispatch table after the handler list changes.
+        New lists are built so a dispatch loop already running keeps iterating the old one.
+        """
+        by_type: Dict[int, List[Callable[[Event], Optional[bool]]]] = {}
+        for handler in self.handlers:
+            on_input = handler.on_input
+            for event_type in getattr(handler, "EVENT_TYPES", DEFAULT_EVENT_TYPES):
+                by_type.setdefault(event_type, []).append(on_input)
+        self._by_type = by_type
+        self._filter_event_queue()
+
+    def _filter_event_queue(self) -> None:
+        """
+        Blocks every event type except QUIT and the types in the dispatch table, so SDL drops
+        unconsumed events (joystick axes, window events, unwanted mouse motion) before they are
+        turned into Python objects.
+        """
+        if not pygame.display.get_init():
+            return  # The event queue needs the video system; the filter is applied on the next refresh.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, *self._by_type])
 
     def register_handler(self, handler: InputHandlerType) -> None:
         """
         Registers an event handler if not already registered.
+        Handlers subclass InputHandler; their on_input is called without an attribute check.
         """
         if handler not in self.handlers:
             self.handlers.append(handler)
+            self._refresh_methods()
 
     def unregister_handler(self, handler: InputHandlerType) -> None:
         """
@@ -37,18 +71,39 @@ class InputManager:
         """
         if handler in self.handlers:
             self.handlers.remove(handler)
+            self._refresh_methods()
 
     def process_event(self, event: Event) -> None:
         """
         Processes a single pygame event using a simplified pipeline:
-          - Only mouse events (MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION) are processed.
-        Version: 1.4.2
+          - The event goes only to the handlers registered for its type (mouse events by default),
+            in registration order, until one returns a truthy value.
+        Version: 1.5.0
         Parameters:
             event: The pygame event to process.
         """
-        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
-            for handler in self.handlers:
-                if hasattr(handler, "on_input") and handler.on_input(event):
-                    return
+        for on_input in self._by_type.get(event.type, ()):
+            if on_input(event):
+                return
+
+    def process_frame(self) -> bool:
+        """
+        Drains the pygame event queue with a single pygame.event.get() call and dispatches every event
+        as process_event would, without a method call per event.
+        Version: 1.5.1
+        Returns:
+            bool: False if a QUIT event was received this frame, True otherwise.
+        """
+        running = True
+        quit_type = pygame.QUIT
+        for event in pygame.event.get():
+            event_type = event.type
+            if event_type == quit_type:
+                running = False
+                continue
+            for on_input in self._by_type.get(event_type, ()):
+                if on_input(event):
+                    break
+        return running
 
 # End of managers/input_manager.py
\ No newline at end of file
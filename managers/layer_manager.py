@@ -1,12 +1,23 @@
 """
 layer_manager.py - Provides a LayerManager for managing scene layers.
-Version: 1.1.0
+Version: 1.5.1
+Summary: Keeps the layers in a z-ordered list by inserting each one at its sorted position, so the
+         layer list is never re-sorted. The ascending and descending z-order tuples, the dynamic
+         and persistent draw tuples, the descending tuple of layers that accept input and the
+         tuple of layers that need update() are rebuilt from it only after the layer list changes.
 """
 
-from typing import List
+from bisect import insort
+from typing import List, Tuple
 import pygame
 from layers.base_layer import BaseLayer
 
+def _z_key(layer: BaseLayer) -> int:
+    """
+    Returns the z-index used to order a layer.
+    """
+    return layer.z
+
 class LayerManager:
     def __init__(self, layers: List[BaseLayer] = None) -> None:
         """
@@ -16,15 +27,28 @@ class LayerManager:
             layers (List[BaseLayer], optional): Initial list of layers. Defaults to None.
         """
         self.layers: List[BaseLayer] = layers or []
-        self._sorted_layers: List[BaseLayer] = []
+        # Always sorted by z; equal z keeps insertion order, as a stable sort would.
+        self._z_order: List[BaseLayer] = sorted(self.layers, key=_z_key)
+        self._sorted_layers: Tuple[BaseLayer, ...] = ()
+        self._sorted_layers_desc: Tuple[BaseLayer, ...] = ()
+        self._dynamic_layers: Tuple[BaseLayer, ...] = ()
+        self._persistent_layers: Tuple[BaseLayer, ...] = ()
+        self._input_layers: Tuple[BaseLayer, ...] = ()
+        self._updaters: Tuple[BaseLayer, ...] = ()
         self._dirty: bool = True
 
     def _sort_layers(self) -> None:
         """
-        Sorts layers based on their z-index if marked as dirty.
+        Rebuilds the cached z-order tuples from the sorted layer list if marked as dirty.
+        Both orders are cached so per-event and per-frame lookups never sort or copy.
         """
         if self._dirty:
-            self._sorted_layers = sorted(self.layers, key=lambda l: l.z)
+            self._sorted_layers = tuple(self._z_order)
+            self._sorted_layers_desc = self._sorted_layers[::-1]
+            self._dynamic_layers = tuple(layer for layer in self._sorted_layers if not layer.persistent)
+            self._persistent_layers = tuple(layer for layer in self._sorted_layers if layer.persistent)
+            self._input_layers = tuple(layer for layer in self._sorted_layers_desc if hasattr(layer, "on_input"))
+            self._updaters = tuple(layer for layer in self._sorted_layers if not layer.UPDATE_IS_NOOP)
             self._dirty = False
 
     def add_layer(self, layer: BaseLayer) -> None:
@@ -35,6 +59,7 @@ class LayerManager:
             layer (BaseLayer): The layer to add.
         """
         self.layers.append(layer)
+        insort(self._z_order, layer, key=_z_key)
         self._dirty = True
 
     def remove_layer(self, layer: BaseLayer) -> None:
@@ -46,12 +71,14 @@ class LayerManager:
         """
         if layer in self.layers:
             self.layers.remove(layer)
+            self._z_order.remove(layer)
             self._dirty = True
 
     def mark_dirty(self) -> None:
         """
-        Marks the layer list as dirty to force re-sorting.
+        Re-sorts the layers. Call this after changing the z-index of a layer that is already added.
         """
+        self._z_order = sorted(self.layers, key=_z_key)
         self._dirty = True
 
     def clear(self) -> None:
@@ -59,19 +86,25 @@ class LayerManager:
         Clears all non‑persistent layers from the manager.
         Persistent layers remain.
         """
-        self.layers = [layer for layer in self.layers if getattr(layer, "persistent", False)]
-        self._sorted_layers = []
+        self.layers = [layer for layer in self.layers if layer.persistent]
+        self._z_order = [layer for layer in self._z_order if layer.persistent]
+        self._sorted_layers = ()
+        self._sorted_layers_desc = ()
+        self._dynamic_layers = ()
+        self._persistent_layers = ()
+        self._input_layers = ()
+        self._updaters = ()
         self._dirty = True
 
     def update(self, dt: float) -> None:
         """
-        Updates all layers.
+        Updates all layers, skipping those whose update() is a no-op.
 
         Parameters:
             dt (float): Delta time in seconds.
         """
         self._sort_layers()
-        for layer in self._sorted_layers:
+        for layer in self._updaters:
             layer.update(dt)
 
     def draw(self, screen: pygame.Surface) -> None:
@@ -85,15 +118,45 @@ class LayerManager:
         for layer in self._sorted_layers:
             layer.draw(screen)
 
-    def get_sorted_layers(self, reverse: bool = False) -> List[BaseLayer]:
+    def get_sorted_layers(self, reverse: bool = False) -> Tuple[BaseLayer, ...]:
         """
-        Returns the sorted list of layers.
+        Returns the layers sorted by z-index.
 
         Parameters:
             reverse (bool, optional): Whether to reverse the order. Defaults to False.
 
         Returns:
-            List[BaseLayer]: The sorted list of layers.
+            Tuple[BaseLayer, ...]: The cached sorted layers.
+        """
+        self._sort_layers()
+        return self._sorted_layers_desc if reverse else self._sorted_layers
+
+    def get_dynamic_layers(self) -> Tuple[BaseLayer, ...]:
+        """
+        Returns the non-persistent layers sorted by z-index.
+
+        Returns:
+            Tuple[BaseLayer, ...]: The cached dynamic layers.
+        """
+        self._sort_layers()
+        return self._dynamic_layers
+
+    def get_persistent_layers(self) -> Tuple[BaseLayer, ...]:
+        """
+        Returns the persistent layers sorted by z-index.
+
+        Returns:
+            Tuple[BaseLayer, ...]: The cached persistent layers.
+        """
+        self._sort_layers()
+        return self._persistent_layers
+
+    def get_input_layers(self) -> Tuple[BaseLayer, ...]:
+        """
+        Returns the layers that implement on_input, highest z-index first.
+
+        Returns:
+            Tuple[BaseLayer, ...]: The cached input layers.
         """
         self._sort_layers()
-        return self._sorted_layers[::-1] if reverse else self._sorted_layers
\ No newline at end of file
+        return self._input_layers
\ No newline at end of file
@@ -1,6 +1,6 @@
 """
 managers/scene_manager.py - Scene manager for handling scene transitions, back navigation, and centralized mouse/touch input.
-Version: 1.1.6
+Version: 1.1.7
 Summary: Manages scenes and transitions. Adds a global directional control layer via the plugin system,
          ensuring that all scenes use a unified mouse/touch-based input method.
 """
@@ -8,12 +8,13 @@ Summary: Manages scenes and transitions. Adds a global directional control layer
 import pygame
 from typing import Dict, Optional
 from core.config import Config
+from core.interfaces import InputHandler
 from managers.input_manager import InputManager
 from scenes.base_scene import BaseScene
 from plugins.plugins import transition_registry, layer_registry
 from transitions.transitions import Transition  # For proper type annotation
 
-class SceneManager:
+class SceneManager(InputHandler):
     def __init__(self, config: Config, input_manager: InputManager) -> None:
         """
         scene_manager.py - Initializes the SceneManager.
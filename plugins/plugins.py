@@ -1,10 +1,12 @@
 """
 plugins/plugins.py - Central plugin registries for scenes, layers, effects, themes, transitions, and play modes.
-Version: 1.3.3
+Version: 1.3.4
 Summary: Added duplicate key checks in registration decorators to warn when duplicate registration is attempted.
+         Layers are also bucketed by category at registration time.
 """
 
 import logging
+from typing import Dict, List, Tuple
 
 # Set up logging configuration if not already configured.
 logging.basicConfig(level=logging.INFO)
@@ -12,6 +14,8 @@ logging.basicConfig(level=logging.INFO)
 # Plugin registries
 scene_registry = {}
 layer_registry = {}   # Unified registry for all layers
+# The same layer entries grouped by category, as (key, entry) pairs in registration order.
+layer_registry_by_category: Dict[str, List[Tuple[str, dict]]] = {}
 effect_registry = {}
 theme_registry = {}
 transition_registry = {}
@@ -39,10 +43,15 @@ def register_layer(key: str, category: str = "foreground"):
         lower_key = key.lower()
         if lower_key in layer_registry:
             logging.warning("Duplicate layer registration for key '%s'. Overwriting previous registration.", key)
-        layer_registry[lower_key] = {
+            previous = layer_registry[lower_key]
+            bucket = layer_registry_by_category[previous["category"]]
+            bucket[:] = [item for item in bucket if item[0] != lower_key]
+        entry = {
             "class": cls,
             "category": category.lower()
         }
+        layer_registry[lower_key] = entry
+        layer_registry_by_category.setdefault(entry["category"], []).append((lower_key, entry))
         return cls
     return decorator
 
@@ -99,7 +108,7 @@ def register_play_mode(key: str):
     return decorator
 
 all = [
-    "scene_registry", "layer_registry", "effect_registry", "theme_registry", "transition_registry", "play_mode_registry",
+    "scene_registry", "layer_registry", "layer_registry_by_category", "effect_registry", "theme_registry", "transition_registry", "play_mode_registry",
     "register_scene", "register_layer", "register_effect", "register_theme", "register_transition", "register_play_mode"
 ]
 
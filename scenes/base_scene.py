@@ -8,7 +8,10 @@ from typing import List, Optional
 from core.config import Config  
 from managers.layer_manager import LayerManager  
 from layers.base_layer import BaseLayer  # For type hinting extra_layers  
-from plugins.plugins import layer_registry  # Import the unified layer registry  
+from plugins.plugins import layer_registry_by_category  # Registered layers grouped by category
+
+# Registry categories whose layers every scene gets.
+UNIVERSAL_LAYER_CATEGORIES = ("background", "effect", "foreground")
   
 class BaseScene:  
     def __init__(  
@@ -40,19 +43,13 @@ class BaseScene:
         Clears non‑persistent layers and repopulates the layer manager with universal layers and scene‑specific layers.  
         """  
         self.layer_manager.clear()  
-        for key, info in layer_registry.items():  
-            if info["category"] in ["background", "effect", "foreground"]:  
-                layer_cls = info["class"]  
-                if any(isinstance(layer, layer_cls) for layer in self.layer_manager.layers):  
-                    continue  
-                try:  
-                    layer_instance = layer_cls(self.font, self.config)  
-                except TypeError:  
-                    try:  
-                        layer_instance = layer_cls(self.config)  
-                    except TypeError:  
-                        layer_instance = layer_cls()  
-                self.layer_manager.add_layer(layer_instance)  
+        for category in UNIVERSAL_LAYER_CATEGORIES:
+            for key, info in layer_registry_by_category.get(category, ()):
+                layer_cls = info["class"]
+                if any(isinstance(layer, layer_cls) for layer in self.layer_manager.layers):
+                    continue
+                # Universal layers all take the standard (font, config) arguments.
+                self.layer_manager.add_layer(layer_cls(self.font, self.config))
         if self.extra_layers:  
             for layer in self.extra_layers:  
                 self.layer_manager.add_layer(layer)  
@@ -77,10 +74,9 @@ class BaseScene:
         Forwards the input event to layers in order of descending z-index until one consumes the event.  
         Each layer’s on_input should return True if the event is handled.
         """  
-        for layer in self.layer_manager.get_sorted_layers(reverse=True):  
-            if hasattr(layer, "on_input"):  
-                if layer.on_input(event):  
-                    break  
+        for layer in self.layer_manager.get_input_layers():
+            if layer.on_input(event):
+                break
   
     def update(self, dt: float) -> None:  
         """  
@@ -92,24 +88,21 @@ class BaseScene:
         """  
         Draws only the non‑persistent (dynamic) layers onto the provided screen.  
         """  
-        for layer in self.layer_manager.get_sorted_layers():  
-            if not getattr(layer, "persistent", False):  
-                layer.draw(screen)  
+        for layer in self.layer_manager.get_dynamic_layers():
+            layer.draw(screen)
   
     def draw_persistent(self, screen: pygame.Surface) -> None:  
         """  
         Draws only the persistent layers onto the provided screen.  
         """  
-        for layer in self.layer_manager.get_sorted_layers():  
-            if getattr(layer, "persistent", False):  
-                layer.draw(screen)  
+        for layer in self.layer_manager.get_persistent_layers():
+            layer.draw(screen)
   
     def draw(self, screen: pygame.Surface) -> None:  
         """  
         Draws the scene onto the provided screen by drawing dynamic layers first, then persistent layers on top.  
         """  
-        bg_color = self.config.theme.background_color  
-        screen.fill(bg_color)  
+        screen.fill(self.config.theme.background_color)
         self.draw_dynamic(screen)  
         self.draw_persistent(screen)  
   
@@ -0,0 +1,10 @@
+"""
+tests/conftest.py - Makes the engine's top-level packages importable from the tests.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# End of tests/conftest.py
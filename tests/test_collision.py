@@ -0,0 +1,61 @@
+"""
+tests/test_collision.py - Checks QuadTree queries against a brute-force overlap scan.
+"""
+
+import random
+from core.collision import QuadTree, aabbs_overlap
+
+BOUNDS = (0.0, 0.0, 100.0, 100.0)
+
+def brute_force(entries, aabb):
+    return sorted(obj for obj, box in entries if aabbs_overlap(box, aabb))
+
+def test_out_of_bounds_entry_survives_split():
+    tree = QuadTree(BOUNDS, capacity=2)
+    outside = (150.0, 150.0, 160.0, 160.0)
+    tree.insert("outside", outside)
+    for i in range(8):  # Enough in-bounds boxes to split the root.
+        tree.insert(i, (5.0 + i, 5.0, 6.0 + i, 6.0))
+    assert tree.query(outside) == ["outside"]
+
+def test_partly_outside_and_straddling_entries_survive_splits():
+    tree = QuadTree(BOUNDS, capacity=1)
+    entries = [
+        ("left_edge", (-5.0, 10.0, 5.0, 20.0)),   # Crosses the root's left edge, inside NW otherwise
+        ("center", (45.0, 45.0, 55.0, 55.0)),     # Straddles all four quadrants
+        ("nw_split", (20.0, 5.0, 30.0, 10.0)),    # Straddles NW's own split line
+    ]
+    entries += [(i, (1.0 + i, 1.0 + i, 2.0 + i, 2.0 + i)) for i in range(10)]
+    for obj, box in entries:
+        tree.insert(obj, box)
+    for obj, box in entries:
+        assert obj in tree.query(box)
+
+def test_random_queries_match_brute_force():
+    rng = random.Random(1234)
+    tree = QuadTree(BOUNDS, capacity=3, max_depth=6)
+    entries = []
+    for i in range(300):
+        x = rng.uniform(-30.0, 130.0)
+        y = rng.uniform(-30.0, 130.0)
+        box = (x, y, x + rng.uniform(0.0, 25.0), y + rng.uniform(0.0, 25.0))
+        entries.append((i, box))
+        tree.insert(i, box)
+    for _ in range(200):
+        x = rng.uniform(-30.0, 130.0)
+        y = rng.uniform(-30.0, 130.0)
+        query = (x, y, x + rng.uniform(0.0, 40.0), y + rng.uniform(0.0, 40.0))
+        assert sorted(tree.query(query)) == brute_force(entries, query)
+
+def test_clear_reuses_pool():
+    tree = QuadTree(BOUNDS, capacity=1)
+    for i in range(20):
+        tree.insert(i, (i * 4.0, i * 4.0, i * 4.0 + 1.0, i * 4.0 + 1.0))
+    tree.clear()
+    assert tree.query(BOUNDS) == []
+    tree.insert("again", (150.0, 150.0, 151.0, 151.0))
+    for i in range(5):
+        tree.insert(i, (10.0 + i, 10.0, 11.0 + i, 11.0))
+    assert tree.query((150.0, 150.0, 151.0, 151.0)) == ["again"]
+
+# End of tests/test_collision.py
@@ -1,7 +1,8 @@
 """
 themes/themes.py - Contains theme definitions and dynamic blending for the application.
 Summary: Provides multiple themes with a blending system; no keyboard references are present.
-Version: 1.5.1
+         Themes are immutable, slotted dataclasses: blending always produces a new Theme.
+Version: 1.6.0
 """
 
 from dataclasses import dataclass
@@ -9,7 +10,7 @@ from typing import Tuple
 from plugins.plugins import register_theme, theme_registry
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Theme:
     background_color: Tuple[int, int, int]
     title_color: Tuple[int, int, int]